@@ -24,6 +24,7 @@ class DataProvider:
         self._bulk_sample_data_cache: Dict[str, Dict[str, List[float]]] = {}
         self._bulk_raw_sample_data_cache: Dict[str, Dict[str, List[float]]] = {}
         self._cache_valid: bool = False
+        self.generation: int = 0
 
     def set_use_legacy_integration(self, use_legacy: bool) -> None:
         if self.use_legacy_integration != use_legacy:
@@ -31,6 +32,17 @@ class DataProvider:
             self.invalidate_cache()
 
     def invalidate_cache(self) -> None:
+        """
+        Mark cached data stale; the next read reloads it on demand.
+
+        Nothing is recomputed here, and repeated invalidations with no reads
+        in between (e.g. several settings changes in a row) return early.
+        ``generation`` is bumped either way so callers can tell whether
+        results they derived from this provider are still current.
+        """
+        self.generation += 1
+        if not (self._cache_valid or self._mrrf_cache or self._background_ratios_cache):
+            return
         self._mrrf_cache.clear()
         self._background_ratios_cache.clear()
         self._bulk_sample_data_cache.clear()
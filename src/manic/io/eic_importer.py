@@ -2,7 +2,7 @@ import logging
 import time
 import zlib
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 
@@ -513,12 +513,13 @@ def regenerate_compound_eics(
     mass_tol: float = 0.25,
     progress_cb: Optional[Callable[[int, int], None]] = None,
     retention_time: Optional[float] = None,
-) -> int:
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> Tuple[int, List[str]]:
     """
     Regenerate EIC data for a specific compound across given samples with new tR window.
 
-    This function deletes existing EIC records for the compound and recalculates them
-    using the new tR window parameter. Session data is NOT touched.
+    This function replaces existing EIC records for the compound sample by sample,
+    recalculating them using the new tR window parameter. Session data is NOT touched.
 
     Parameters
     ----------
@@ -534,11 +535,17 @@ def regenerate_compound_eics(
         Optional callback for GUI progress bars
     retention_time : float | None
         Retention time to center the window at. If None, uses compound default.
+    should_cancel : Callable[[], bool] | None
+        Polled before each sample; when it returns True the remaining samples
+        are skipped and keep their existing EIC records.
 
     Returns
     -------
-    int
-        Number of EIC rows regenerated
+    tuple[int, list[str]]
+        Number of EIC rows regenerated, and the samples whose EIC was
+        replaced. Samples skipped by ``should_cancel``, or whose CDF file is
+        missing or has no data in the new window, are left out; they keep
+        their previous EIC (and its ``rt_window``).
     """
     start = time.time()
 
@@ -583,35 +590,35 @@ def regenerate_compound_eics(
     done = 0
     regenerated = 0
 
-    # Delete existing EIC and corrected records for this compound
-    with get_connection() as conn:
-        # Delete raw EIC records
-        delete_result = conn.execute(
-            "DELETE FROM eic WHERE compound_name = ? AND sample_name IN ({})".format(
-                ",".join("?" * len(sample_names))
-            ),
-            [compound_name] + sample_names,
+    def _delete_existing(conn, sample_name: str) -> None:
+        # Raw and corrected records are replaced together
+        conn.execute(
+            "DELETE FROM eic WHERE compound_name = ? AND sample_name = ?",
+            (compound_name, sample_name),
         )
-        deleted_count = delete_result.rowcount
-        logger.info(
-            f"Deleted {deleted_count} existing EIC records for '{compound_name}'"
+        conn.execute(
+            "DELETE FROM eic_corrected WHERE compound_name = ? AND sample_name = ?",
+            (compound_name, sample_name),
         )
 
-        # Also delete corrected EIC records
-        delete_corrected_result = conn.execute(
-            "DELETE FROM eic_corrected WHERE compound_name = ? AND sample_name IN ({})".format(
-                ",".join("?" * len(sample_names))
-            ),
-            [compound_name] + sample_names,
-        )
-        deleted_corrected_count = delete_corrected_result.rowcount
-        if deleted_corrected_count > 0:
+    # Samples missing from the database have nothing to regenerate from
+    missing = [s for s in sample_names if s not in sample_files]
+    if missing:
+        with get_connection() as conn:
+            for sample_name in missing:
+                _delete_existing(conn, sample_name)
+
+    # Regenerate EICs for each sample. Old records are replaced per sample rather
+    # than deleted up front, so cancelling part-way (or a sample that fails to
+    # regenerate) leaves the remaining samples intact.
+    replaced = []
+    for sample_name, cdf_path in sample_files.items():
+        if should_cancel is not None and should_cancel():
             logger.info(
-                f"Deleted {deleted_corrected_count} existing corrected EIC records for '{compound_name}'"
+                f"Regeneration of '{compound_name}' cancelled after {done} of {total_work} samples"
             )
+            break
 
-    # Regenerate EICs for each sample
-    for sample_name, cdf_path in sample_files.items():
         try:
             # Check if CDF file exists
             if not cdf_path.exists():
@@ -621,14 +628,16 @@ def regenerate_compound_eics(
                     progress_cb(done, total_work)
                 continue
 
-            # Read CDF file and extract EIC
+            # Read CDF file and extract EIC before touching the stored records,
+            # so a read or extraction failure leaves the old EIC in place
             cdf = read_cdf_file(cdf_path)
             eic = extract_eic(
                 compound_name, rt, mz, cdf, mass_tol, tr_window, label_atoms
             )
 
-            # Insert new EIC record
+            # Replace the old records with the new EIC in one transaction
             with get_connection() as conn:
+                _delete_existing(conn, sample_name)
                 conn.execute(
                     """
                     INSERT INTO eic (
@@ -648,6 +657,7 @@ def regenerate_compound_eics(
                 )
 
             regenerated += 1
+            replaced.append(sample_name)
             logger.debug(
                 f"Regenerated EIC for '{compound_name}' in sample '{sample_name}' - time range: {eic.time.min():.3f} to {eic.time.max():.3f} min"
             )
@@ -677,8 +687,9 @@ def regenerate_compound_eics(
         logger.info(
             f"Recalculating natural abundance corrections for '{compound_name}'..."
         )
+        # Samples that were not replaced still hold their previous correction
         corrections_count = 0
-        for sample_name in sample_names:
+        for sample_name in replaced:
             if apply_correction_to_eic(sample_name, compound_name):
                 corrections_count += 1
         if corrections_count > 0:
@@ -688,7 +699,7 @@ def regenerate_compound_eics(
     except Exception as e:
         logger.warning(f"Failed to recalculate corrections for '{compound_name}': {e}")
 
-    return regenerated
+    return regenerated, replaced
 
 
 def regenerate_all_eics_with_mass_tolerance(
@@ -1,5 +1,6 @@
 import logging
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
@@ -14,6 +15,9 @@ DB_FILE = Path.home() / ".manic_app" / "manic.db"
 # Path to schema.sql that works in both dev and frozen builds
 SCHEMA_SQL_PATH = Path(resource_path('models', 'schema.sql'))
 
+# Per-thread connection reused by get_read_connection()
+_read_local = threading.local()
+
 
 def init_db() -> None:
     """
@@ -33,6 +37,8 @@ def init_db() -> None:
         # Apply base schema
         with SCHEMA_SQL_PATH.open("r", encoding="utf-8") as fh:
             conn.executescript(fh.read())
+        # Refresh planner statistics so the new indexes get picked up
+        conn.execute("PRAGMA optimize")
 
     logger.info("database ready at %s", DB_FILE)
 
@@ -219,6 +225,24 @@ def get_connection():
             conn.close()
 
 
+def get_read_connection() -> sqlite3.Connection:
+    """
+    Return a long-lived autocommit connection for cheap read-only queries.
+
+    One connection is kept per thread, so frequent small lookups skip the
+    open/PRAGMA cost of get_connection() and reuse SQLite's statement cache.
+    Autocommit means no read transaction is held open between calls, so
+    every query sees the latest committed data. Use get_connection() for
+    anything that writes.
+    """
+    conn = getattr(_read_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_FILE, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        _read_local.conn = conn
+    return conn
+
+
 def soft_delete_compound(compound_name: str) -> bool:
     """
     Soft delete a compound by setting deleted = 1.
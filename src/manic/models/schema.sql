@@ -22,6 +22,9 @@ CREATE TABLE IF NOT EXISTS compounds (
 CREATE INDEX IF NOT EXISTS idx_compounds_name
           ON compounds(compound_name);
 
+CREATE INDEX IF NOT EXISTS idx_compounds_labeled
+          ON compounds(label_atoms, deleted);
+
 -- Samples ---------------------------------------------------------
 CREATE TABLE IF NOT EXISTS samples (
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -80,3 +83,29 @@ CREATE TABLE IF NOT EXISTS eic_corrected (
 
 CREATE INDEX IF NOT EXISTS idx_eic_corrected_sample_compound
           ON eic_corrected(sample_name, compound_name);
+
+CREATE INDEX IF NOT EXISTS idx_eic_compound_deleted
+          ON eic(compound_name, deleted, sample_name);
+
+-- Superseded by the UNIQUE(sample_name, compound_name) autoindex; dropped so
+-- databases that already created it stop paying for it on every write
+DROP INDEX IF EXISTS idx_eic_corrected_lookup;
+
+-- Active labelled-compound EICs with no active corrected row ----
+-- Dropped and recreated on every start so definition changes reach
+-- existing databases
+DROP VIEW IF EXISTS v_missing_corrections;
+CREATE VIEW v_missing_corrections AS
+    SELECT e.id, e.sample_name, e.compound_name
+    FROM eic e
+    JOIN compounds c ON e.compound_name = c.compound_name
+    WHERE e.deleted = 0
+      AND c.deleted = 0
+      AND c.label_atoms > 0
+      AND NOT EXISTS (
+          SELECT 1
+          FROM eic_corrected ec
+          WHERE ec.sample_name = e.sample_name
+            AND ec.compound_name = e.compound_name
+            AND ec.deleted = 0
+      );
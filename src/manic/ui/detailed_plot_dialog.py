@@ -439,14 +439,8 @@ class DetailedPlotDialog(QDialog):
             right_bound = rt + self.compound_info.roffset
 
             # Render integration boundary markers with transparency
-            self.eic_plot.add_vertical_line(
-                left_bound,
-                color=f"rgba(255,0,0,{GUIDELINE_ALPHA})",
-                width=PLOT_GUIDELINE_WIDTH,
-                style="dashed",
-            )
-            self.eic_plot.add_vertical_line(
-                right_bound,
+            self.eic_plot.add_vertical_lines(
+                [left_bound, right_bound],
                 color=f"rgba(255,0,0,{GUIDELINE_ALPHA})",
                 width=PLOT_GUIDELINE_WIDTH,
                 style="dashed",
@@ -1,10 +1,19 @@
+import functools
 import logging
 import os
 from pathlib import Path
 
 import numpy as np
 
-from PySide6.QtCore import QCoreApplication, Qt, QThread, QTimer, QUrl
+from PySide6.QtCore import (
+    QAbstractEventDispatcher,
+    QCoreApplication,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    QUrl,
+)
 from PySide6.QtGui import (
     QAction,
     QDesktopServices,  # Add this for opening URLs
@@ -23,6 +32,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QProgressDialog,
+    QPushButton,
     QRadioButton,
     QSplitter,
     QVBoxLayout,
@@ -31,32 +41,146 @@ from PySide6.QtWidgets import (
     QFormLayout,
 )
 
-from manic.__version__ import APP_NAME, __version__
+from manic.__version__ import APP_DESCRIPTION, APP_NAME, __version__
+from manic.constants import DEFAULT_RT_WINDOW
 from manic.io.compounds_import import import_compound_excel
 from manic.io.data_exporter import DataExporter, validate_internal_standard_metadata
 from manic.io.data_provider import DataProvider
+from manic.io.eic_importer import regenerate_compound_eics
+from manic.io.legacy_rebuild import rebuild_export_from_files
 from manic.io.list_compound_names import list_compound_names
 from manic.io.sample_reader import list_active_samples
 from manic.io.compound_reader import read_compound_with_session
 from manic.processors.integration import calculate_peak_areas
-from manic.models.database import clear_database, get_connection
+from manic.models.database import get_connection, get_read_connection
+from manic.models.session_activity import SessionActivityService
+from manic.models.session_export import (
+    export_session_method,
+    get_method_info,
+    import_session_overrides,
+    validate_method_file,
+)
+from manic.processors.eic_correction_manager import process_all_corrections
+from manic.processors.eic_processing import get_eics_for_compound
 from manic.ui.documentation_viewer import show_documentation_file
 from manic.ui.graphs import GraphView
 from manic.ui.left_toolbar import Toolbar
 from manic.ui.toast_notification import ToastNotification
-from manic.ui.toast_notification import ToastNotification
+from manic.ui.update_old_data_dialog import UpdateOldDataDialog
 from manic.utils.paths import docs_path, resource_path
 from manic.utils.utils import load_stylesheet
 from manic.utils.workers import (
     CdfImportWorker,
-    EicRegenerationWorker,
+    ClearDatabaseWorker,
     MassToleranceReloadWorker,
     UpdateCheckWorker,
+    Worker,
 )
 from src.manic.utils.timer import measure_time
 
 logger = logging.getLogger("manic_logger")
 
+# Menu layouts: (label, slot method, action attribute, checkable); None = separator
+_FILE_MENU_SPEC = (
+    (
+        "Load Compounds/Parameter List",
+        "load_compound_list_data",
+        "load_compound_action",
+        False,
+    ),
+    ("Load Raw Data (CDF)", "load_cdf_files", "load_cdf_action", False),
+    None,
+    ("Export Session...", "export_method", "export_method_action", False),
+    ("Import Session...", "import_session", "import_session_action", False),
+    ("Clear Session", "clear_session", "clear_session_action", False),
+    None,
+    ("Export Data...", "export_data", "export_data_action", False),
+    None,
+    ("Process External Data...", "update_old_data", "update_old_data_action", False),
+)
+
+_SETTINGS_MENU_SPEC = (
+    ("Mass Tolerance...", "show_mass_tolerance_dialog", "mass_tolerance_action", False),
+    (
+        "Minimum Peak Area...",
+        "show_min_peak_height_dialog",
+        "min_peak_height_action",
+        False,
+    ),
+    (
+        "Labelled Internal Standard...",
+        "show_labelled_internal_standard_dialog",
+        "labelled_internal_standard_action",
+        False,
+    ),
+    (
+        "Preview Natural Abundance Correction: Off",
+        "toggle_natural_abundance_correction",
+        "nat_abundance_toggle",
+        True,
+    ),
+    (
+        "Legacy Integration Mode: Off",
+        "toggle_legacy_integration_mode",
+        "legacy_integration_toggle",
+        True,
+    ),
+)
+
+_HELP_MENU_SPEC = (("About MANIC...", "show_about", "about_action", False),)
+
+_ABOUT_HTML = f"""<h2>{APP_NAME} v{__version__}</h2>
+<p><b>{APP_DESCRIPTION}</b></p>
+<p>This application provides tools for analyzing natural isotope composition in mass spectrometry data.</p>
+<p><b>Features:</b></p>
+<ul>
+<li>Compound definition and parameter management</li>
+<li>Raw CDF data processing</li>
+<li>Session export/import for reproducible analysis</li>
+<li>Integration boundary customization</li>
+<li>Isotopologue ratio analysis</li>
+</ul>
+<p><b>Version:</b> v{__version__}</p>"""
+
+# Missing-corrections check; kept as constants so the read connection's
+# statement cache reuses the compiled statements across calls
+_SQL_ANY_LABELLED_COMPOUND = (
+    "SELECT 1 FROM compounds WHERE label_atoms > 0 AND deleted = 0 LIMIT 1"
+)
+_SQL_MISSING_CORRECTIONS = "SELECT COUNT(*) FROM v_missing_corrections"
+
+
+@functools.lru_cache(maxsize=4)
+def _list_docs(docs_dir: str, mtime: float) -> tuple[tuple[Path, str], ...]:
+    """
+    ``(path, display name)`` for the markdown files in ``docs_dir``,
+    getting_started first, then alphabetical.
+
+    ``mtime`` is only part of the cache key: adding or removing a file bumps
+    the directory mtime, so the listing is re-read only when it changed.
+    """
+    # scandir reports the entry type without a stat() per file, and the sort
+    # keys are built once per entry rather than per comparison
+    with os.scandir(docs_dir) as it:
+        entries = [
+            (entry.name != "getting_started.md", entry.name.lower(), entry.path)
+            for entry in it
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
+    entries.sort()
+    # Menu labels are derived here so they are cached with the listing
+    paths = [Path(path) for _, _, path in entries]
+    return tuple((p, p.stem.replace("_", " ").title()) for p in paths)
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_icon() -> QIcon | None:
+    """Load the MANIC logo once; window and dialog icons share the QIcon."""
+    logo_path = resource_path("resources", "manic_logo.png")
+    if os.path.exists(logo_path):
+        return QIcon(logo_path)
+    return None
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -67,6 +191,9 @@ class MainWindow(QMainWindow):
         # Flag to prevent cascading compound deletion events
         self._deleting_compound = False
 
+        # Flag to make toolbar selection slots ignore clear_session's list resets
+        self._clearing_session = False
+
         # Flag to prevent cascading sample deletion events
         self._deleting_samples = False
 
@@ -101,11 +228,56 @@ class MainWindow(QMainWindow):
         self.compound_data_loaded = False
         self.cdf_data_loaded = False
 
-        # Cached DataProvider for validation (reused to avoid repeated bulk loads)
-        self._validation_provider = None
+        # True while an EIC regeneration (single compound or mass tolerance
+        # reload) is running; a second one would race on the same EIC rows
+        self._regen_in_flight = False
+
+        # Progress dialogs for the running regeneration, None when idle
+        self.regen_progress_dialog: QProgressDialog | None = None
+        self.mass_tol_progress_dialog: QProgressDialog | None = None
+
+        # Last _validate_samples results with the settings they were computed
+        # under, so a regeneration only revalidates the samples it touched
+        self._validation_memo: tuple[tuple, dict] | None = None
+        self._regen_samples: list = []
+
+        # Set while a post-import replot is queued for the idle event loop
+        self._session_refresh_pending = False
+
+        # Progress dialog of a clear_session in progress, None when idle
+        self._clear_progress: QProgressDialog | None = None
+
+        # (data_version, count) from the last missing-corrections query
+        self._missing_corrections_cache: tuple[int, int] | None = None
+
+        # Settings and export options dialogs, built on first open and reused
+        self._mass_tol_dialog: QDialog | None = None
+        self._min_peak_height_dialog: QDialog | None = None
+        self._export_options_dialog: QDialog | None = None
+
+        # Cap the shared thread pool; idealThreadCount() can be dozens on
+        # cluster nodes, which only contends for the GIL and SQLite
+        self.max_workers = min(32, os.cpu_count() or 4)
+        QThreadPool.globalInstance().setMaxThreadCount(self.max_workers)
+
+        # DataProvider for validation (reused to avoid repeated bulk loads).
+        # Construction is cheap (caches fill on first use), so build it once here
+        # and keep its integration mode in sync instead of rebuilding lazily.
+        self._validation_provider = DataProvider(
+            use_legacy_integration=self.use_legacy_integration
+        )
 
         self.setup_ui()
 
+        # Actions that must stay disabled while EICs are being reloaded
+        self._data_actions = (
+            self.load_cdf_action,
+            self.load_compound_action,
+            self.export_data_action,
+            self.export_method_action,
+            self.mass_tolerance_action,
+        )
+
         # Load and apply the stylesheet
         stylesheet = load_stylesheet(resource_path("resources", "style.qss"))
         self.setStyleSheet(stylesheet)
@@ -230,105 +402,27 @@ class MainWindow(QMainWindow):
 
         """ Create File Menu """
 
-        # Initiate the file menu
         file_menu = menu_bar.addMenu("File")
-
-        # Create the actions/logic for loading compound list data
-        self.load_compound_action = QAction("Load Compounds/Parameter List", self)
-        self.load_compound_action.triggered.connect(self.load_compound_list_data)
-        # Add the load compound action/logic to the file menu
-        file_menu.addAction(self.load_compound_action)
-
-        # Create the actions/logic for loading CDF files
-        self.load_cdf_action = QAction("Load Raw Data (CDF)", self)
-        self.load_cdf_action.triggered.connect(self.load_cdf_files)
-        # Add the load CDF action/logic to the file menu
-        file_menu.addAction(self.load_cdf_action)
-
-        # Add a separator to the file menu
-        file_menu.addSeparator()
-
-        # Create method export/import actions
-        self.export_method_action = QAction("Export Session...", self)
-        self.export_method_action.triggered.connect(self.export_method)
-        file_menu.addAction(self.export_method_action)
-
-        self.import_session_action = QAction("Import Session...", self)
-        self.import_session_action.triggered.connect(self.import_session)
-        file_menu.addAction(self.import_session_action)
-
-        # Create the Clear Session action
-        self.clear_session_action = QAction("Clear Session", self)
-        self.clear_session_action.triggered.connect(self.clear_session)
-        # Add the clear session action to the file menu
-        file_menu.addAction(self.clear_session_action)
-
-        # Add separator before export data
-        file_menu.addSeparator()
-
-        # Create export data action
-        self.export_data_action = QAction("Export Data...", self)
-        self.export_data_action.triggered.connect(self.export_data)
-        file_menu.addAction(self.export_data_action)
-
-        # Add separator and Update Old Data action
-        file_menu.addSeparator()
-        self.update_old_data_action = QAction("Process External Data...", self)
-        self.update_old_data_action.triggered.connect(self.update_old_data)
-        file_menu.addAction(self.update_old_data_action)
+        self._add_menu_actions(file_menu, _FILE_MENU_SPEC)
 
         """ Create Settings Menu """
 
         settings_menu = menu_bar.addMenu("Settings")
-
-        self.mass_tolerance_action = QAction("Mass Tolerance...", self)
-        self.mass_tolerance_action.triggered.connect(self.show_mass_tolerance_dialog)
-        settings_menu.addAction(self.mass_tolerance_action)
-
-        self.min_peak_height_action = QAction("Minimum Peak Area...", self)
-        self.min_peak_height_action.triggered.connect(self.show_min_peak_height_dialog)
-        settings_menu.addAction(self.min_peak_height_action)
-
-        self.labelled_internal_standard_action = QAction(
-            "Labelled Internal Standard...", self
-        )
-        self.labelled_internal_standard_action.triggered.connect(
-            self.show_labelled_internal_standard_dialog
-        )
-        settings_menu.addAction(self.labelled_internal_standard_action)
-
-        # Natural abundance correction toggle action
-        self.nat_abundance_toggle = QAction(
-            "Preview Natural Abundance Correction: Off", self
-        )
-        self.nat_abundance_toggle.setCheckable(True)
-        self.nat_abundance_toggle.setChecked(False)  # Off by default
-        self.nat_abundance_toggle.triggered.connect(
-            self.toggle_natural_abundance_correction
-        )
-        settings_menu.addAction(self.nat_abundance_toggle)
-
-        # Legacy integration mode toggle action
-        self.legacy_integration_toggle = QAction("Legacy Integration Mode: Off", self)
-        self.legacy_integration_toggle.setCheckable(True)
-        self.legacy_integration_toggle.setChecked(False)  # Off by default
-        self.legacy_integration_toggle.triggered.connect(
-            self.toggle_legacy_integration_mode
-        )
-        settings_menu.addAction(self.legacy_integration_toggle)
+        self._add_menu_actions(settings_menu, _SETTINGS_MENU_SPEC)
 
         """ Create Documentation Menu """
 
+        # Populated on each open so startup doesn't touch the docs folder and
+        # files added or removed while running show up
         docs_menu = menu_bar.addMenu("Documentation")
-        self._create_documentation_menu(docs_menu)
+        docs_menu.aboutToShow.connect(
+            functools.partial(self._create_documentation_menu, docs_menu)
+        )
 
         """ Create Help Menu """
 
         help_menu = menu_bar.addMenu("Help")
-
-        self.about_action = QAction("About MANIC...", self)
-        self.about_action.triggered.connect(self.show_about)
-        help_menu.addAction(self.about_action)
+        self._add_menu_actions(help_menu, _HELP_MENU_SPEC)
 
         # Set the menu bar to the QMainWindow
         self.setMenuBar(menu_bar)
@@ -360,6 +454,26 @@ class MainWindow(QMainWindow):
             self.on_baseline_correction_changed
         )
 
+    def _add_menu_actions(self, menu, spec) -> None:
+        """Create the actions described by a menu spec and add them to ``menu``.
+
+        Each entry is ``(label, slot_name, attr_name, checkable)``; ``None``
+        entries become separators. Actions are stored on ``self`` under
+        ``attr_name`` so the rest of the window can enable/relabel them.
+        """
+        for entry in spec:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, slot_name, attr_name, checkable = entry
+            action = QAction(label, self)
+            if checkable:
+                action.setCheckable(True)
+                action.setChecked(False)  # Off by default
+            action.triggered.connect(getattr(self, slot_name))
+            setattr(self, attr_name, action)
+            menu.addAction(action)
+
     def _get_logo_path(self) -> str:
         """Get the path to the MANIC logo."""
         # Try to find the logo relative to this file
@@ -370,9 +484,9 @@ class MainWindow(QMainWindow):
 
     def _set_window_icon(self):
         """Set the window icon to the MANIC logo."""
-        logo_path = self._get_logo_path()
-        if logo_path:
-            self.setWindowIcon(QIcon(logo_path))
+        icon = _logo_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
     def _create_message_box(
         self,
@@ -434,10 +548,6 @@ class MainWindow(QMainWindow):
         self.export_method_action.setEnabled(self.compound_data_loaded)
 
         # Export Data: enabled only if compound data, CDF data loaded
-        internal_standard = self.toolbar.get_internal_standard()
-        has_internal_standard = (
-            internal_standard is not None and internal_standard != ""
-        )
         self.export_data_action.setEnabled(
             self.compound_data_loaded and self.cdf_data_loaded
         )
@@ -486,19 +596,27 @@ class MainWindow(QMainWindow):
             )
 
     # reusable progress dialog
-    def _build_progress_dialog(self, title: str) -> QProgressDialog:
-        dlg = QProgressDialog(title, None, 0, 100, self)
+    def _build_progress_dialog(
+        self, title: str, cancellable: bool = False
+    ) -> QProgressDialog:
+        dlg = QProgressDialog(title, "Cancel" if cancellable else None, 0, 100, self)
         dlg.setWindowTitle("Please wait")
         dlg.setWindowModality(Qt.WindowModal)
         dlg.setAutoClose(False)
         dlg.setAutoReset(False)
         dlg.setMinimumDuration(0)  # Show immediately
-        dlg.setCancelButton(None)  # Remove cancel button for simplicity
+        if not cancellable:
+            dlg.setCancelButton(None)  # Remove cancel button for simplicity
+        else:
+            # QProgressDialog.cancel() hides and resets the dialog even with
+            # autoClose off; the caller's canceled slot keeps it open until
+            # the work has actually stopped, then closes it
+            dlg.canceled.disconnect(dlg.cancel)
 
         # Set the logo
-        logo_path = self._get_logo_path()
-        if logo_path:
-            dlg.setWindowIcon(QIcon(logo_path))
+        icon = _logo_icon()
+        if icon is not None:
+            dlg.setWindowIcon(icon)
 
         return dlg
 
@@ -508,7 +626,6 @@ class MainWindow(QMainWindow):
         2. Call the load_compound_list controller function to load the compound list.
 
         """
-        from pathlib import Path
 
         default_dir = str(Path.home() / "Documents")
         file_path, _ = QFileDialog.getOpenFileName(
@@ -561,13 +678,14 @@ class MainWindow(QMainWindow):
         self._thread.start()
 
     def _update_import_progress(self, current: int, total: int):
-        pct = int(current / total * 100)
-        self.progress_dialog.setMaximum(100)
+        # The worker reports every file; only repaint when the percent moves
+        pct = current * 100 // total if total else 0
+        if pct == self.progress_dialog.value():
+            return
         self.progress_dialog.setValue(pct)
         self.progress_dialog.setLabelText("Importing…")
-        QCoreApplication.processEvents()
 
-    def _import_ok(self, rows: int):
+    def _import_ok(self, rows: int, active_samples: list):
         self.progress_dialog.close()
 
         # Non-blocking success notification (avoid modal popup)
@@ -596,8 +714,9 @@ class MainWindow(QMainWindow):
         # set raw data indicator to green
         self.toolbar.update_label_colours(True, True)
 
-        # get active samples
-        active_samples = list_active_samples()
+        # active samples are read by the worker; only re-query if it sent none
+        if not active_samples:
+            active_samples = list_active_samples()
 
         # update samples list in toolbar
         # update to samples list in toolbar will trigger plotting
@@ -634,11 +753,6 @@ class MainWindow(QMainWindow):
             return True
 
         try:
-            if self._validation_provider is None:
-                self._validation_provider = DataProvider(
-                    use_legacy_integration=self.use_legacy_integration
-                )
-
             return self._validation_provider.validate_peak_area(
                 sample_name,
                 compound_name,
@@ -653,6 +767,61 @@ class MainWindow(QMainWindow):
             )
             return True
 
+    def _validation_key(self, compound_name: str) -> tuple:
+        """Everything a validation result depends on besides the sample."""
+        return (
+            compound_name,
+            self.toolbar.get_internal_standard(),
+            self.min_peak_height_ratio,
+            self.internal_standard_reference_isotope,
+            self._validation_provider.generation,
+        )
+
+    def _reusable_validation(self, compound_name: str, changed_samples) -> dict:
+        """
+        Return the last validation results for ``compound_name`` minus
+        ``changed_samples``, or {} if they were computed under other settings
+        or provider data. Call before invalidating the provider.
+        """
+        if self._validation_memo is None:
+            return {}
+        key, results = self._validation_memo
+        if key != self._validation_key(compound_name):
+            return {}
+        return {s: v for s, v in results.items() if s not in changed_samples}
+
+    def _validate_samples(
+        self, compound_name: str, samples: list, reuse: dict | None = None
+    ) -> dict:
+        """
+        Validate a compound across several samples.
+
+        Returns an empty dict when validation is disabled. The validation
+        provider's bulk cache is filled once up front, so each sample is then
+        a dictionary lookup rather than a database round trip. Samples found
+        in ``reuse`` keep that result instead of being validated again.
+        """
+        if self.min_peak_height_ratio <= 0 or not samples:
+            return {}
+
+        reuse = reuse or {}
+        if any(sample not in reuse for sample in samples):
+            try:
+                self._validation_provider.load_bulk_sample_data()
+            except Exception as e:
+                logger.warning(f"Could not preload validation data: {e}")
+
+        results = {
+            sample: (
+                reuse[sample]
+                if sample in reuse
+                else self._validate_peak_area(compound_name, sample)
+            )
+            for sample in samples
+        }
+        self._validation_memo = (self._validation_key(compound_name), results)
+        return results
+
     def on_plot_button(self, compound_name, samples):
         # Validate inputs before plotting
         if not compound_name or compound_name.startswith("- No"):
@@ -665,12 +834,7 @@ class MainWindow(QMainWindow):
             if samples:
                 with measure_time("total_plotting_speed"):
                     # Calculate validation data for all samples
-                    validation_data = {}
-                    if self.min_peak_height_ratio > 0:  # Only if validation is enabled
-                        for sample in samples:
-                            validation_data[sample] = self._validate_peak_area(
-                                compound_name, sample
-                            )
+                    validation_data = self._validate_samples(compound_name, samples)
 
                     self.graph_view.plot_compound(
                         compound_name, samples, validation_data
@@ -718,7 +882,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error plotting: {e}")
             msg_box = self._create_message_box(
-                "warning", "Error", f"Error plotting: {str(e)}"
+                "warning", "Error", f"Error plotting: {e}"
             )
             msg_box.exec()
 
@@ -731,8 +895,6 @@ class MainWindow(QMainWindow):
             return []
 
         try:
-            from manic.processors.eic_processing import get_eics_for_compound
-
             return get_eics_for_compound(compound, samples)
         except Exception as e:
             logger.error(f"Error getting current EICs: {e}")
@@ -770,6 +932,8 @@ class MainWindow(QMainWindow):
         This method will be called whenever a different compound is selected in the toolbar.
         'selected_text' is the text of the selected item (passed from the signal).
         """
+        if self._clearing_session:
+            return
         samples = self.toolbar.get_selected_samples()
         self.on_plot_button(compound_selected, samples)
 
@@ -778,7 +942,7 @@ class MainWindow(QMainWindow):
         Handle compound deletion - refresh UI and invalidate caches.
         Called when compounds are soft-deleted via the context menu.
         """
-        if self._deleting_compound:
+        if self._deleting_compound or self._clearing_session:
             return
 
         self._deleting_compound = True
@@ -801,8 +965,7 @@ class MainWindow(QMainWindow):
             data_provider = DataProvider()
             data_provider.invalidate_cache()
 
-            if self._validation_provider:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             logger.info(f"Deleted {len(compound_names)} compound(s)")
 
@@ -825,8 +988,7 @@ class MainWindow(QMainWindow):
             data_provider = DataProvider()
             data_provider.invalidate_cache()
 
-            if self._validation_provider:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             logger.info(f"Restored {len(compound_names)} compound(s)")
 
@@ -861,8 +1023,7 @@ class MainWindow(QMainWindow):
             data_provider = DataProvider()
             data_provider.invalidate_cache()
 
-            if self._validation_provider:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             logger.info(f"Deleted {len(sample_names)} sample(s)")
 
@@ -885,8 +1046,7 @@ class MainWindow(QMainWindow):
             data_provider = DataProvider()
             data_provider.invalidate_cache()
 
-            if self._validation_provider:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             logger.info(f"Restored {len(sample_names)} sample(s)")
 
@@ -894,6 +1054,8 @@ class MainWindow(QMainWindow):
             logger.error(f"Error during sample restoration: {e}")
 
     def on_samples_selected(self, samples_selected):
+        if self._clearing_session:
+            return
         compound = self.toolbar.get_selected_compound()
         self.on_plot_button(compound, samples_selected)
 
@@ -906,8 +1068,7 @@ class MainWindow(QMainWindow):
         self.internal_standard_reference_isotope = 0
 
         # Invalidate validation cache since threshold may change
-        if self._validation_provider is not None:
-            self._validation_provider.invalidate_cache()
+        self._validation_provider.invalidate_cache()
 
         # Update menu states to enable/disable Export Data based on internal standard selection
         self._update_menu_states()
@@ -949,24 +1110,18 @@ class MainWindow(QMainWindow):
 
         try:
             # Invalidate validation provider cache since integration boundaries changed
-            if self._validation_provider is not None:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             # Re-validate with new session data
-            validation_data = {}
-            if self.min_peak_height_ratio > 0:
-                current_samples = self.graph_view.get_current_samples()
-                for sample in current_samples:
-                    validation_data[sample] = self._validate_peak_area(
-                        compound_name, sample
-                    )
+            validation_data = self._validate_samples(
+                compound_name, self.graph_view.get_current_samples()
+            )
 
             # Refresh plots with session data and updated validation
             self.graph_view.refresh_plots_with_session_data(validation_data)
 
             # After refreshing plots, update the integration window to show the new values
             # Add a small delay to ensure the plot refresh is fully complete
-            from PySide6.QtCore import QTimer
 
             def update_integration_window():
                 current_selected = self.graph_view.get_selected_samples()
@@ -1004,7 +1159,7 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "warning",
                 "Refresh Failed",
-                f"Failed to refresh plots with updated parameters: {str(e)}",
+                f"Failed to refresh plots with updated parameters: {e}",
             )
             msg_box.exec()
 
@@ -1016,38 +1171,11 @@ class MainWindow(QMainWindow):
             # Refresh plots with default data (session data has been removed)
             self.graph_view.refresh_plots_with_session_data()
 
-            # After refreshing plots, update the integration window to show the default values
-            from PySide6.QtCore import QTimer
-
-            def update_integration_window():
-                current_selected = self.graph_view.get_selected_samples()
-                all_samples = self.graph_view.get_current_samples()
-
-                if compound_name:
-                    self.toolbar.integration.populate_fields_from_plots(
-                        compound_name, current_selected, all_samples
-                    )
-
-            # Use a timer to delay the update slightly
-            QTimer.singleShot(100, update_integration_window)
-
-            # Update isotopologue ratios and total abundance with restored default parameters
-            def update_charts():
-                current_eics = self._get_current_eics()
-                self.toolbar.isotopologue_ratios.update_ratios(
-                    compound_name, current_eics
-                )
-
-                # Share calculated abundances
-                abundances, eics = (
-                    self.toolbar.isotopologue_ratios.get_last_total_abundances()
-                )
-                if abundances is not None:
-                    self.toolbar.total_abundance.update_abundance_from_data(
-                        compound_name, eics, abundances
-                    )
-
-            QTimer.singleShot(150, update_charts)
+            # Once the event loop has drained the pending paint/layout work from
+            # the refresh, update the integration window and charts in one pass
+            self._run_when_event_loop_idle(
+                lambda: self._finalize_session_restore(compound_name)
+            )
 
         except Exception as e:
             logger.error(f"Failed to refresh plots after session data restore: {e}")
@@ -1055,10 +1183,50 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "warning",
                 "Refresh Failed",
-                f"Failed to refresh plots after restore: {str(e)}",
+                f"Failed to refresh plots after restore: {e}",
             )
             msg_box.exec()
 
+    def _finalize_session_restore(self, compound_name: str):
+        """Show restored default parameters in the integration window and charts."""
+        if compound_name:
+            self.toolbar.integration.populate_fields_from_plots(
+                compound_name,
+                self.graph_view.get_selected_samples(),
+                self.graph_view.get_current_samples(),
+            )
+
+        # Update isotopologue ratios and total abundance with restored default parameters
+        current_eics = self._get_current_eics()
+        self.toolbar.isotopologue_ratios.update_ratios(compound_name, current_eics)
+
+        # Share calculated abundances
+        abundances, eics = self.toolbar.isotopologue_ratios.get_last_total_abundances()
+        if abundances is not None:
+            self.toolbar.total_abundance.update_abundance_from_data(
+                compound_name, eics, abundances
+            )
+
+    def _run_when_event_loop_idle(self, callback):
+        """Run ``callback`` once, the next time the event loop has nothing left to do.
+
+        Uses the dispatcher's aboutToBlock signal, which fires when all pending
+        events (including paints queued by a replot) have been processed.
+        """
+        dispatcher = QAbstractEventDispatcher.instance()
+        if dispatcher is None:
+            QTimer.singleShot(0, callback)
+            return
+
+        def _once():
+            dispatcher.aboutToBlock.disconnect(_once)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Deferred UI update failed: {e}")
+
+        dispatcher.aboutToBlock.connect(_once)
+
     def on_baseline_correction_changed(self, compound_name: str, enabled: bool):
         """Handle when baseline correction checkbox is toggled - refresh plots to show/hide baseline lines"""
         logger.info(
@@ -1067,23 +1235,17 @@ class MainWindow(QMainWindow):
 
         try:
             # Invalidate validation provider cache since peak areas may change
-            if self._validation_provider is not None:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             # Re-validate with new baseline correction setting
-            validation_data = {}
-            if self.min_peak_height_ratio > 0:
-                current_samples = self.graph_view.get_current_samples()
-                for sample in current_samples:
-                    validation_data[sample] = self._validate_peak_area(
-                        compound_name, sample
-                    )
+            validation_data = self._validate_samples(
+                compound_name, self.graph_view.get_current_samples()
+            )
 
             # Refresh plots to show/hide baseline lines
             self.graph_view.refresh_plots_with_session_data(validation_data)
 
             # Update isotopologue ratios and total abundance (areas change with baseline correction)
-            from PySide6.QtCore import QTimer
 
             def update_charts():
                 current_eics = self._get_current_eics()
@@ -1109,7 +1271,7 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "warning",
                 "Refresh Failed",
-                f"Failed to refresh plots with baseline correction: {str(e)}",
+                f"Failed to refresh plots with baseline correction: {e}",
             )
             msg_box.exec()
 
@@ -1124,56 +1286,67 @@ class MainWindow(QMainWindow):
         logger.info(
             f"Data regeneration requested for compound '{compound_name}' with tR window {tr_window} centered at RT {retention_time:.3f}"
         )
+        if self._reject_if_regen_in_flight():
+            return
+        self._regen_in_flight = True
+        self._regen_samples = list(sample_names)
 
         try:
             # Build and show progress dialog
             self.regen_progress_dialog = self._build_progress_dialog(
-                f"Regenerating EIC data for '{compound_name}'..."
+                f"Regenerating EIC data for '{compound_name}'...", cancellable=True
             )
             self.regen_progress_dialog.show()
 
-            # Create background thread and worker
-            self._regen_thread = QThread(self)
-            self._regen_worker = EicRegenerationWorker(
-                compound_name, tr_window, sample_names, retention_time
+            # Run the regeneration on the global thread pool; keep a reference
+            # so the worker's signals outlive the runnable until completion
+            self._regen_worker = Worker(
+                regenerate_compound_eics,
+                compound_name=compound_name,
+                tr_window=tr_window,
+                sample_names=sample_names,
+                retention_time=retention_time,
+                progress_callback=True,
+                cancellable=True,
+            )
+            self.regen_progress_dialog.canceled.connect(self._cancel_regeneration)
+            # Escape rejects (hides) the dialog without emitting canceled
+            self.regen_progress_dialog.rejected.connect(self._cancel_regeneration)
+
+            # Connect progress updates (queued: delivered by the GUI event loop;
+            # the worker only emits when the percentage changes)
+            self._regen_worker.signals.progress.connect(
+                self._update_regeneration_progress, Qt.QueuedConnection
             )
-            self._regen_worker.moveToThread(self._regen_thread)
-
-            # Connect progress updates
-            self._regen_worker.progress.connect(self._update_regeneration_progress)
 
             # Connect completion/failure handlers
-            self._regen_worker.finished.connect(self._regeneration_completed)
-            self._regen_worker.failed.connect(self._regeneration_failed)
-            self._regen_worker.finished.connect(self._regen_thread.quit)
-            self._regen_worker.failed.connect(self._regen_thread.quit)
+            self._regen_worker.signals.finished.connect(self._regeneration_completed)
+            self._regen_worker.signals.cancelled.connect(self._regeneration_cancelled)
+            self._regen_worker.signals.failed.connect(self._regeneration_failed)
 
-            # Start the background work
-            self._regen_thread.started.connect(self._regen_worker.run)
-            self._regen_thread.finished.connect(self._regen_thread.deleteLater)
-            self._regen_thread.start()
+            QThreadPool.globalInstance().start(self._regen_worker)
 
         except Exception as e:
+            self._regen_in_flight = False
             logger.error(f"Failed to start regeneration: {e}")
             msg_box = self._create_message_box(
                 "critical",
                 "Regeneration Error",
-                f"Failed to start data regeneration: {str(e)}",
+                f"Failed to start data regeneration: {e}",
             )
             msg_box.exec()
 
     def _on_mass_tolerance_changed(self, new_mass_tol: float):
         """Handle mass tolerance change - regenerate all EICs with new tolerance"""
-        from manic.constants import DEFAULT_RT_WINDOW
 
         logger.info(f"Starting EIC regeneration with mass tolerance {new_mass_tol} Da")
+        if self._reject_if_regen_in_flight():
+            return
+        self._regen_in_flight = True
 
         try:
             # Disable UI during regeneration
-            self.load_cdf_action.setEnabled(False)
-            self.load_compound_action.setEnabled(False)
-            self.export_data_action.setEnabled(False)
-            self.export_method_action.setEnabled(False)
+            self._set_data_actions_enabled(False)
 
             # Build and show progress dialog
             self.mass_tol_progress_dialog = self._build_progress_dialog(
@@ -1188,8 +1361,11 @@ class MainWindow(QMainWindow):
             )
             self._mass_tol_worker.moveToThread(self._mass_tol_thread)
 
-            # Connect progress updates
-            self._mass_tol_worker.progress.connect(self._update_mass_tolerance_progress)
+            # Connect progress updates (queued: delivered by the GUI event loop;
+            # the worker only emits when the percentage changes)
+            self._mass_tol_worker.progress.connect(
+                self._update_mass_tolerance_progress, Qt.QueuedConnection
+            )
 
             # Connect completion/failure handlers
             self._mass_tol_worker.finished.connect(
@@ -1210,43 +1386,37 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "critical",
                 "Reload Error",
-                f"Failed to start EIC regeneration: {str(e)}",
+                f"Failed to start EIC regeneration: {e}",
             )
             msg_box.exec()
 
-    def _update_mass_tolerance_progress(self, current: int, total: int):
+    def _update_mass_tolerance_progress(self, pct: int):
         """Update mass tolerance regeneration progress dialog"""
-        if hasattr(self, "mass_tol_progress_dialog"):
-            pct = int(current / total * 100) if total > 0 else 0
-            self.mass_tol_progress_dialog.setMaximum(100)
+        if self.mass_tol_progress_dialog is not None:
             self.mass_tol_progress_dialog.setValue(pct)
-            self.mass_tol_progress_dialog.setLabelText(
-                f"Processing {current} of {total}..."
-            )
-            QCoreApplication.processEvents()
 
     def _mass_tolerance_reload_completed(self, regenerated_count: int):
         """Handle successful mass tolerance reload completion"""
-        if hasattr(self, "mass_tol_progress_dialog"):
+        if self.mass_tol_progress_dialog is not None:
             self.mass_tol_progress_dialog.close()
+            self.mass_tol_progress_dialog = None
 
         logger.info(
             f"Mass tolerance reload completed: {regenerated_count} EICs regenerated"
         )
 
-        # Invalidate caches
-        data_provider = DataProvider()
-        data_provider.invalidate_cache()
-
-        # Invalidate validation provider cache
-        if self._validation_provider is not None:
+        # Nothing was rewritten, so cached areas and the current plots are
+        # still valid; skip the invalidation and the full replot
+        if regenerated_count > 0:
+            # Drop cached areas computed from the old EICs. This only clears
+            # in-memory dicts (no disk or DB access), so it stays on the GUI thread.
             self._validation_provider.invalidate_cache()
 
-        # Refresh plots
-        current_compound = self.toolbar.get_selected_compound()
-        current_samples = self.toolbar.get_selected_samples()
-        if current_compound and current_samples:
-            self.on_plot_button(current_compound, current_samples)
+            # Refresh plots
+            current_compound = self.toolbar.get_selected_compound()
+            current_samples = self.toolbar.get_selected_samples()
+            if current_compound and current_samples:
+                self.on_plot_button(current_compound, current_samples)
 
         # Re-enable UI
         self._re_enable_ui_actions()
@@ -1261,8 +1431,9 @@ class MainWindow(QMainWindow):
 
     def _mass_tolerance_reload_failed(self, error_msg: str):
         """Handle mass tolerance reload failure"""
-        if hasattr(self, "mass_tol_progress_dialog"):
+        if self.mass_tol_progress_dialog is not None:
             self.mass_tol_progress_dialog.close()
+            self.mass_tol_progress_dialog = None
 
         logger.error(f"Mass tolerance reload failed: {error_msg}")
 
@@ -1276,92 +1447,132 @@ class MainWindow(QMainWindow):
         )
         msg_box.exec()
 
+    def _reject_if_regen_in_flight(self) -> bool:
+        """Tell the user and return True if a regeneration is already running."""
+        if not self._regen_in_flight:
+            return False
+        logger.warning("EIC regeneration already running; ignoring new request")
+        msg_box = self._create_message_box(
+            "information",
+            "Regeneration In Progress",
+            "EIC data is already being regenerated.",
+            "Please wait for it to finish and try again.",
+        )
+        msg_box.exec()
+        return True
+
+    def _set_data_actions_enabled(self, enabled: bool):
+        """
+        Toggle all data actions in a single state transition.
+
+        When enabling, the export actions still follow what data is loaded.
+        """
+        states = dict.fromkeys(self._data_actions, enabled)
+        if enabled:
+            states[self.export_method_action] = self.compound_data_loaded
+            states[self.export_data_action] = (
+                self.cdf_data_loaded and self.compound_data_loaded
+            )
+
+        for action, state in states.items():
+            action.setEnabled(state)
+
     def _re_enable_ui_actions(self):
         """Re-enable UI actions after background operations"""
-        self.load_cdf_action.setEnabled(True)
-        self.load_compound_action.setEnabled(True)
-        # Re-enable export actions based on data state
-        self.export_method_action.setEnabled(self.compound_data_loaded)
-        self.export_data_action.setEnabled(
-            self.cdf_data_loaded and self.compound_data_loaded
-        )
+        self._regen_in_flight = False
+        self._set_data_actions_enabled(True)
 
-    def _update_regeneration_progress(self, current: int, total: int):
+    def _update_regeneration_progress(self, pct: int):
         """Update regeneration progress dialog"""
-        if hasattr(self, "regen_progress_dialog"):
-            pct = int(current / total * 100) if total > 0 else 0
-            self.regen_progress_dialog.setMaximum(100)
+        if self.regen_progress_dialog is not None:
             self.regen_progress_dialog.setValue(pct)
-            self.regen_progress_dialog.setLabelText(
-                f"Processing sample {current} of {total}..."
+
+    def _apply_pending_session_update(self, skipped_samples=()) -> set:
+        """
+        Apply the session update queued by Apply once its EIC reload is done.
+
+        Samples in *skipped_samples* were due a reload that never happened
+        (cancelled first, or their CDF could not be read), so they keep the
+        session data that matches their stored EIC. Returns the samples whose
+        session data was updated.
+        """
+        integration = self.toolbar.integration
+        pending = getattr(integration, "_pending_session_update", None)
+        if pending is None:
+            return set()
+
+        retention_time, loffset, roffset, samples_to_apply = pending
+        skipped = set(skipped_samples)
+        samples_to_apply = [s for s in samples_to_apply if s not in skipped]
+        samples_regenerated = [
+            s
+            for s in getattr(integration, "_samples_regenerated", [])
+            if s not in skipped
+        ]
+
+        compound_name = self.graph_view.get_current_compound()
+        if samples_to_apply:
+            if retention_time is None:
+                SessionActivityService.update_offsets_preserve_rt(
+                    compound_name=compound_name,
+                    sample_names=samples_to_apply,
+                    loffset=loffset,
+                    roffset=roffset,
+                )
+            else:
+                SessionActivityService.update_session_data(
+                    compound_name=compound_name,
+                    sample_names=samples_to_apply,
+                    retention_time=retention_time,
+                    loffset=loffset,
+                    roffset=roffset,
+                )
+
+        # Refresh data window bounds for the regenerated samples
+        # Use the list of samples that were actually regenerated, not all samples_to_apply
+        if samples_regenerated:
+            logger.info(
+                f"Refreshing bounds for {len(samples_regenerated)} regenerated samples"
             )
-            QCoreApplication.processEvents()
+            integration.refresh_data_window_bounds(compound_name, samples_regenerated)
+        else:
+            logger.warning("No samples_regenerated list found, skipping bounds refresh")
+
+        # Clear the pending update and regenerated list
+        integration._pending_session_update = None
+        integration._samples_regenerated = []
 
-    def _regeneration_completed(self, regenerated_count: int):
+        rt_text = "per-sample" if retention_time is None else f"{retention_time:.3f}"
+        logger.info(
+            f"Applied pending session update to {len(samples_to_apply)} samples after EIC reload: "
+            f"RT={rt_text}, loffset={loffset:.3f}, roffset={roffset:.3f}"
+        )
+        return set(samples_to_apply)
+
+    def _regeneration_completed(self, result):
         """Handle successful regeneration completion"""
-        if hasattr(self, "regen_progress_dialog"):
+        regenerated_count, replaced = result
+        self._regen_worker = None
+        self._regen_in_flight = False
+        if self.regen_progress_dialog is not None:
             self.regen_progress_dialog.close()
+            self.regen_progress_dialog = None
 
         logger.info(
             f"Regeneration completed successfully: {regenerated_count} EICs regenerated"
         )
 
-        try:
-            # Check if there's a pending session update from Apply button (auto-reload feature)
-            if (
-                hasattr(self.toolbar.integration, "_pending_session_update")
-                and self.toolbar.integration._pending_session_update is not None
-            ):
-                # Apply the pending session update now that data has been reloaded
-                retention_time, loffset, roffset, samples_to_apply = (
-                    self.toolbar.integration._pending_session_update
-                )
-
-                from manic.models.session_activity import SessionActivityService
+        # Samples whose areas may differ from the last validation pass
+        changed_samples = set(self._regen_samples)
+        # Samples whose CDF was missing or empty still hold the old-window EIC
+        not_replaced = set(self._regen_samples) - set(replaced)
 
-                compound_name = self.graph_view.get_current_compound()
-
-                if retention_time is None:
-                    SessionActivityService.update_offsets_preserve_rt(
-                        compound_name=compound_name,
-                        sample_names=samples_to_apply,
-                        loffset=loffset,
-                        roffset=roffset,
-                    )
-                else:
-                    SessionActivityService.update_session_data(
-                        compound_name=compound_name,
-                        sample_names=samples_to_apply,
-                        retention_time=retention_time,
-                        loffset=loffset,
-                        roffset=roffset,
-                    )
-
-                # Refresh data window bounds for the regenerated samples
-                # Use the list of samples that were actually regenerated, not all samples_to_apply
-                current_compound = self.graph_view.get_current_compound()
-                samples_regenerated = getattr(
-                    self.toolbar.integration, "_samples_regenerated", []
-                )
-                if samples_regenerated:
-                    logger.info(
-                        f"Refreshing bounds for {len(samples_regenerated)} regenerated samples"
-                    )
-                    self.toolbar.integration.refresh_data_window_bounds(
-                        current_compound, samples_regenerated
-                    )
-                else:
-                    logger.warning(
-                        "No samples_regenerated list found, skipping bounds refresh"
-                    )
-
-                # Clear the pending update and regenerated list
-                self.toolbar.integration._pending_session_update = None
-                self.toolbar.integration._samples_regenerated = []
-
-                logger.info(
-                    f"Applied pending session update after EIC reload: RT={retention_time:.3f}, loffset={loffset:.3f}, roffset={roffset:.3f}"
-                )
+        try:
+            # Apply the pending session update from the Apply button
+            # (auto-reload feature) now that data has been reloaded
+            changed_samples.update(
+                self._apply_pending_session_update(skipped_samples=not_replaced)
+            )
 
             # Update integration window BEFORE refreshing plots
             # This ensures the plots draw RT lines at the correct (updated) positions
@@ -1380,26 +1591,40 @@ class MainWindow(QMainWindow):
                 self.toolbar.integration.populate_tr_window_field(current_compound)
 
                 # NOW replot with fresh EIC data and updated integration parameters
-                # The plots will draw RT lines at the correct new positions
-                validation_data = {}
-                if self.min_peak_height_ratio > 0:  # Only if validation is enabled
-                    for sample in current_samples:
-                        validation_data[sample] = self._validate_peak_area(
-                            current_compound, sample
-                        )
+                # The plots will draw RT lines at the correct new positions.
+                # Validation has to run here rather than in the worker: it
+                # depends on the pending session update applied above, and the
+                # provider's cached areas predate the regenerated EICs.
+                # Areas only changed for the regenerated/updated samples, so
+                # the others keep their previous result.
+                reuse = self._reusable_validation(current_compound, changed_samples)
+                self._validation_provider.invalidate_cache()
+                validation_data = self._validate_samples(
+                    current_compound, current_samples, reuse=reuse
+                )
                 self.graph_view.refresh_plots_with_session_data(validation_data)
             else:
                 # Fallback to session data refresh
                 self.graph_view.refresh_plots_with_session_data()
 
             # Show success message
-            msg_box = self._create_message_box(
-                "information",
-                "Regeneration Complete",
-                f"Data regeneration completed successfully!\n\n"
-                f"Regenerated {regenerated_count} EIC records.\n"
-                f"Plots have been refreshed with new data.",
-            )
+            if not_replaced:
+                msg_box = self._create_message_box(
+                    "warning",
+                    "Regeneration Complete with Warning",
+                    f"Regenerated {regenerated_count} EIC records.\n\n"
+                    f"{len(not_replaced)} sample(s) could not be regenerated "
+                    f"and keep their previous EIC data and integration "
+                    f"settings: {', '.join(sorted(not_replaced))}",
+                )
+            else:
+                msg_box = self._create_message_box(
+                    "information",
+                    "Regeneration Complete",
+                    f"Data regeneration completed successfully!\n\n"
+                    f"Regenerated {regenerated_count} EIC records.\n"
+                    f"Plots have been refreshed with new data.",
+                )
             msg_box.exec()
 
         except Exception as e:
@@ -1408,15 +1633,78 @@ class MainWindow(QMainWindow):
                 "warning",
                 "Regeneration Complete with Warning",
                 f"Data regeneration completed ({regenerated_count} EICs), "
-                f"but plot refresh failed: {str(e)}\n\n"
+                f"but plot refresh failed: {e}\n\n"
                 f"Try manually refreshing the plots.",
             )
             msg_box.exec()
 
+    def _cancel_regeneration(self):
+        """Ask the running regeneration to stop after the current sample."""
+        # Also reached when a handler closes the dialog once the worker is done
+        if self._regen_worker is None:
+            return
+        self._regen_worker.cancel()
+        dlg = self.regen_progress_dialog
+        if dlg is not None:
+            # Stay open with feedback while the current sample and the
+            # corrections pass finish; the worker's signal closes the dialog
+            dlg.setLabelText("Cancelling after the current sample...")
+            cancel_button = dlg.findChild(QPushButton)
+            if cancel_button is not None:
+                cancel_button.setEnabled(False)
+            # Escape and the title bar's close button hide it first
+            dlg.show()
+
+    def _regeneration_cancelled(self, result):
+        """Handle a regeneration the user cancelled part-way through"""
+        regenerated_count, replaced = result
+        self._regen_worker = None
+        self._regen_in_flight = False
+        if self.regen_progress_dialog is not None:
+            self.regen_progress_dialog.close()
+            self.regen_progress_dialog = None
+
+        logger.info(f"Regeneration cancelled after {regenerated_count} EICs")
+
+        # Replaced samples already hold EICs for the new window, so they get
+        # the queued session update; the ones never reached (or whose CDF
+        # could not be read) keep their old data and session values
+        skipped = set(self._regen_samples) - set(replaced)
+        try:
+            self._apply_pending_session_update(skipped_samples=skipped)
+        except Exception as e:
+            logger.error(f"Failed to apply session update after cancel: {e}")
+
+        # Some samples may already hold new EICs, so refresh what is shown
+        self._validation_provider.invalidate_cache()
+        current_compound = self.graph_view.get_current_compound()
+        current_samples = self.graph_view.get_current_samples()
+        if current_compound and current_samples:
+            self.toolbar.integration.populate_fields_from_plots(
+                current_compound,
+                self.graph_view.get_selected_samples(),
+                current_samples,
+            )
+            self.toolbar.integration.populate_tr_window_field(current_compound)
+        validation_data = self._validate_samples(current_compound, current_samples)
+        self.graph_view.refresh_plots_with_session_data(validation_data)
+
+        msg_box = self._create_message_box(
+            "information",
+            "Regeneration Cancelled",
+            f"Regeneration was cancelled after {regenerated_count} EIC records.",
+            "Samples that were not reached, or could not be regenerated, keep "
+            "their previous EIC data and integration settings.",
+        )
+        msg_box.exec()
+
     def _regeneration_failed(self, error_msg: str):
         """Handle regeneration failure"""
-        if hasattr(self, "regen_progress_dialog"):
+        self._regen_worker = None
+        self._regen_in_flight = False
+        if self.regen_progress_dialog is not None:
             self.regen_progress_dialog.close()
+            self.regen_progress_dialog = None
 
         logger.error(f"Regeneration failed: {error_msg}")
         msg_box = self._create_message_box(
@@ -1429,9 +1717,6 @@ class MainWindow(QMainWindow):
 
     def export_method(self):
         """Export current analytical session to a file."""
-        from PySide6.QtWidgets import QFileDialog
-
-        from manic.models.session_export import export_session_method
 
         # Get export file path
         file_path, _ = QFileDialog.getSaveFileName(
@@ -1450,7 +1735,6 @@ class MainWindow(QMainWindow):
             if success:
                 # Show info about what was exported
                 # Extract base name to show directory structure
-                from pathlib import Path
 
                 export_path = Path(file_path)
                 if export_path.suffix.lower() == ".json":
@@ -1486,19 +1770,12 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "critical",
                 "Export Error",
-                f"An error occurred during export:\n{str(e)}",
+                f"An error occurred during export:\n{e}",
             )
             msg_box.exec()
 
     def import_session(self):
         """Import session overrides from a session file."""
-        from PySide6.QtWidgets import QFileDialog
-
-        from manic.models.session_export import (
-            get_method_info,
-            import_session_overrides,
-            validate_method_file,
-        )
 
         # Get import file path
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1617,17 +1894,12 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "critical",
                 "Import Error",
-                f"An error occurred during session import:\n{str(e)}",
+                f"An error occurred during session import:\n{e}",
             )
             msg_box.exec()
 
     def update_old_data(self):
         """Rebuild an export from a legacy compounds file and Raw Values workbook."""
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QFileDialog, QProgressDialog
-
-        from manic.io.legacy_rebuild import rebuild_export_from_files
-        from manic.ui.update_old_data_dialog import UpdateOldDataDialog
 
         dlg = UpdateOldDataDialog(self)
         if dlg.exec() != QDialog.Accepted:
@@ -1652,20 +1924,22 @@ class MainWindow(QMainWindow):
         progress_dialog.setMinimumDuration(0)
         progress_dialog.setCancelButton(None)
 
-        def progress_cb(val):
-            progress_dialog.setValue(int(val))
-            QCoreApplication.processEvents()
+        # Rebuild on the thread pool; progress arrives as queued signals so
+        # the dialog repaints without pumping the event loop by hand
+        worker = Worker(
+            rebuild_export_from_files,
+            compounds_path,
+            raw_values_path,
+            out_path,
+            internal_standard=internal_standard,
+            use_legacy_integration=self.use_legacy_integration,
+            progress_callback="progress_callback",
+        )
 
-        try:
-            success = rebuild_export_from_files(
-                compounds_path,
-                raw_values_path,
-                out_path,
-                internal_standard=internal_standard,
-                use_legacy_integration=self.use_legacy_integration,
-                progress_callback=progress_cb,
-            )
+        def on_done(success):
+            self._rebuild_worker = None
             progress_dialog.setValue(100)
+            progress_dialog.close()
             if success:
                 msg = self._create_message_box(
                     "information",
@@ -1673,16 +1947,27 @@ class MainWindow(QMainWindow):
                     f"Export rebuilt successfully to:\n{out_path}",
                 )
                 msg.exec()
-        except Exception as e:
-            logger.error(f"Update Old Data error: {e}")
-            progress_dialog.setValue(0)
+
+        def on_failed(error_msg):
+            self._rebuild_worker = None
+            logger.error(f"Update Old Data error: {error_msg}")
+            progress_dialog.close()
             msg = self._create_message_box(
                 "critical",
                 "Update Failed",
-                f"Failed to rebuild export.\n{e}",
+                f"Failed to rebuild export.\n{error_msg}",
             )
             msg.exec()
 
+        worker.signals.progress.connect(progress_dialog.setValue, Qt.QueuedConnection)
+        worker.signals.finished.connect(on_done)
+        worker.signals.failed.connect(on_failed)
+
+        # Keep the runnable (and its signals) alive until it reports back
+        self._rebuild_worker = worker
+        progress_dialog.show()
+        QThreadPool.globalInstance().start(worker)
+
     def _refresh_after_session_import(self):
         """Refresh display after session import if data is currently displayed."""
         try:
@@ -1692,19 +1977,26 @@ class MainWindow(QMainWindow):
             self.toolbar.update_compound_list(active_compounds)
             self.toolbar.update_sample_list(active_samples)
 
-            # If we have compound and samples selected, refresh the display
-            selected_compound = self.toolbar.get_selected_compound()
-            selected_samples = self.toolbar.get_selected_samples()
-
-            if selected_compound and selected_samples:
-                # Regenerate the plots with new session data
-                self.on_samples_selected(selected_samples)
+            # Replot once the success dialog has closed and repainted;
+            # repeated imports before that share a single refresh
+            if not self._session_refresh_pending:
+                self._session_refresh_pending = True
+                self._run_when_event_loop_idle(self._replot_after_session_import)
 
         except Exception as e:
             logger.error(f"Failed to refresh after session import: {e}")
 
-    def show_mass_tolerance_dialog(self):
-        """Show dialog to edit mass tolerance setting."""
+    def _replot_after_session_import(self):
+        """Regenerate the plots with new session data for the current selection."""
+        self._session_refresh_pending = False
+        selected_compound = self.toolbar.get_selected_compound()
+        selected_samples = self.toolbar.get_selected_samples()
+
+        if selected_compound and selected_samples:
+            self.on_samples_selected(selected_samples)
+
+    def _build_mass_tolerance_dialog(self) -> QDialog:
+        """Build the mass tolerance dialog; its spinbox is kept on self."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Mass Tolerance Settings")
         dialog.setModal(True)
@@ -1725,7 +2017,6 @@ class MainWindow(QMainWindow):
         mass_tol_spinbox.setRange(0.01, 1.0)
         mass_tol_spinbox.setSingleStep(0.01)
         mass_tol_spinbox.setDecimals(3)
-        mass_tol_spinbox.setValue(self.mass_tolerance)
         # Remove suffix and set button symbols to nothing (removes spin buttons)
         mass_tol_spinbox.setButtonSymbols(QDoubleSpinBox.NoButtons)
         # Set white background with white text
@@ -1745,10 +2036,20 @@ class MainWindow(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
 
+        self._mass_tol_spinbox = mass_tol_spinbox
+        return dialog
+
+    def show_mass_tolerance_dialog(self):
+        """Show dialog to edit mass tolerance setting."""
+        # Built on first open and reused; only the value is refreshed
+        if self._mass_tol_dialog is None:
+            self._mass_tol_dialog = self._build_mass_tolerance_dialog()
+        self._mass_tol_spinbox.setValue(self.mass_tolerance)
+
         # Show dialog and handle result
-        if dialog.exec() == QDialog.Accepted:
+        if self._mass_tol_dialog.exec() == QDialog.Accepted:
             old_value = self.mass_tolerance
-            new_value = mass_tol_spinbox.value()
+            new_value = self._mass_tol_spinbox.value()
 
             if old_value != new_value:
                 logger.info(
@@ -1760,8 +2061,8 @@ class MainWindow(QMainWindow):
                 if self.cdf_data_loaded:
                     self._on_mass_tolerance_changed(new_value)
 
-    def show_min_peak_height_dialog(self):
-        """Show dialog to edit minimum peak area setting."""
+    def _build_min_peak_height_dialog(self) -> QDialog:
+        """Build the minimum peak area dialog; its spinbox is kept on self."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Minimum Peak Area Settings")
         dialog.setModal(True)
@@ -1787,7 +2088,6 @@ class MainWindow(QMainWindow):
         peak_area_spinbox.setRange(0.001, 1.0)
         peak_area_spinbox.setSingleStep(0.001)
         peak_area_spinbox.setDecimals(3)
-        peak_area_spinbox.setValue(self.min_peak_height_ratio)
         peak_area_spinbox.setButtonSymbols(QDoubleSpinBox.NoButtons)
         peak_area_spinbox.setStyleSheet(
             "QDoubleSpinBox { background-color: white; color: black; }"
@@ -1810,10 +2110,20 @@ class MainWindow(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
 
+        self._min_peak_height_spinbox = peak_area_spinbox
+        return dialog
+
+    def show_min_peak_height_dialog(self):
+        """Show dialog to edit minimum peak area setting."""
+        # Built on first open and reused; only the value is refreshed
+        if self._min_peak_height_dialog is None:
+            self._min_peak_height_dialog = self._build_min_peak_height_dialog()
+        self._min_peak_height_spinbox.setValue(self.min_peak_height_ratio)
+
         # Show dialog and handle result
-        if dialog.exec() == QDialog.Accepted:
+        if self._min_peak_height_dialog.exec() == QDialog.Accepted:
             old_value = self.min_peak_height_ratio
-            new_value = peak_area_spinbox.value()
+            new_value = self._min_peak_height_spinbox.value()
             self.min_peak_height_ratio = new_value
 
             if old_value != new_value:
@@ -1909,8 +2219,7 @@ class MainWindow(QMainWindow):
             self.internal_standard_reference_isotope = new_idx
 
             # Invalidate validation cache (threshold reference peak changed)
-            if self._validation_provider is not None:
-                self._validation_provider.invalidate_cache()
+            self._validation_provider.invalidate_cache()
 
             # Refresh plots if data is loaded
             if self.cdf_data_loaded and self.compound_data_loaded:
@@ -1921,39 +2230,40 @@ class MainWindow(QMainWindow):
 
     def _create_documentation_menu(self, docs_menu):
         """Create documentation menu with available markdown files."""
+        # Actions are parented to the menu, so clear() also deletes them
+        docs_menu.clear()
+
         # Get the docs directory path
         # From src/manic/ui/main_window.py, go up to project root, then to docs
-        docs_dir = Path(docs_path())
+        docs_dir = docs_path()
 
-        if not docs_dir.exists():
-            no_docs_action = QAction("No documentation available", self)
+        # A single stat both checks the directory exists and keys the cache
+        try:
+            docs_mtime = os.stat(docs_dir).st_mtime
+        except OSError:
+            no_docs_action = QAction("No documentation available", docs_menu)
             no_docs_action.setEnabled(False)
             docs_menu.addAction(no_docs_action)
             return
 
-        # Find all markdown files in the docs directory
-        md_files = list(docs_dir.glob("*.md"))
+        # Find all markdown files in the docs directory (sorted, cached)
+        md_files = _list_docs(docs_dir, docs_mtime)
 
         if not md_files:
-            no_files_action = QAction("No documentation files found", self)
+            no_files_action = QAction("No documentation files found", docs_menu)
             no_files_action.setEnabled(False)
             docs_menu.addAction(no_files_action)
             return
 
-        # Sort files - put getting_started first, then alphabetical
-        md_files.sort(key=lambda f: (f.name != "getting_started.md", f.name.lower()))
-
-        # Create menu actions for each markdown file
-        for md_file in md_files:
-            # Create a nice display name from the filename
-            display_name = md_file.stem.replace("_", " ").title()
-
-            action = QAction(display_name, self)
-            # Use lambda with default argument to capture the file path
+        # Create menu actions for each markdown file, then add them in one go
+        actions = []
+        for md_file, display_name in md_files:
+            action = QAction(display_name, docs_menu)
             action.triggered.connect(
-                lambda checked, file_path=md_file: self._show_documentation(file_path)
+                functools.partial(self._show_documentation, md_file)
             )
-            docs_menu.addAction(action)
+            actions.append(action)
+        docs_menu.addActions(actions)
 
     def _show_documentation(self, file_path: Path):
         """Show a documentation file in the viewer dialog."""
@@ -1964,29 +2274,15 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "critical",
                 "Documentation Error",
-                f"Failed to open documentation file:\n{str(e)}",
+                f"Failed to open documentation file:\n{e}",
             )
             msg_box.exec()
 
     def show_about(self):
         """Show About dialog with version information."""
-        from manic.__version__ import APP_DESCRIPTION
-
-        about_text = f"""<h2>{APP_NAME} v{__version__}</h2>
-<p><b>{APP_DESCRIPTION}</b></p>
-<p>This application provides tools for analyzing natural isotope composition in mass spectrometry data.</p>
-<p><b>Features:</b></p>
-<ul>
-<li>Compound definition and parameter management</li>
-<li>Raw CDF data processing</li>
-<li>Session export/import for reproducible analysis</li>
-<li>Integration boundary customization</li>
-<li>Isotopologue ratio analysis</li>
-</ul>
-<p><b>Version:</b> v{__version__}</p>"""
 
         msg_box = self._create_message_box(
-            "information", f"About {APP_NAME}", about_text
+            "information", f"About {APP_NAME}", _ABOUT_HTML
         )
         msg_box.exec()
 
@@ -2009,13 +2305,12 @@ class MainWindow(QMainWindow):
             progress.setValue(0)
             progress.show()
             QCoreApplication.processEvents()  # Ensure dialog appears
+            self._clear_progress = progress
+            # Toolbar selection slots ignore the cascade of signals the
+            # list resets below would otherwise trigger
+            self._clearing_session = True
 
             try:
-                # Temporarily disconnect signals to prevent cascading events during clear
-                self.toolbar.samples_selected.disconnect()
-                self.toolbar.compound_selected.disconnect()
-                self.toolbar.compounds_deleted.disconnect()
-
                 progress.setValue(10)
                 progress.setLabelText("Clearing UI state...")
                 QCoreApplication.processEvents()
@@ -2053,83 +2348,106 @@ class MainWindow(QMainWindow):
 
                 progress.setValue(40)
                 progress.setLabelText("Clearing database...")
-                QCoreApplication.processEvents()
+                # The UI is already cleared, so the database step runs to completion
+                progress.setCancelButton(None)
 
-                # Define progress callback for database clearing
-                def db_progress_callback(current, total, operation):
-                    if progress.wasCanceled():
-                        return
+                # Clear the database on a worker thread; progress arrives as
+                # queued signals, so the dialog repaints without manual pumping
+                self._clear_thread = QThread(self)
+                self._clear_worker = ClearDatabaseWorker()
+                self._clear_worker.moveToThread(self._clear_thread)
 
-                    # Map database progress to 40-90% of total progress
-                    db_progress_percent = int(40 + (current / total) * 50)
-                    progress.setValue(db_progress_percent)
-                    progress.setLabelText(operation)
-
-                    # OPTIMIZATION: Reduce UI update frequency for better performance
-                    # Only update UI every 25% or on operation changes
-                    if (
-                        current == 0
-                        or current == total
-                        or db_progress_percent % 25 == 0
-                    ):
-                        QCoreApplication.processEvents()
-
-                # Clear the database with progress tracking (fast mode enabled by default)
-                clear_database(progress_callback=db_progress_callback)
-
-                if progress.wasCanceled():
-                    progress.close()
-                    return
+                self._clear_worker.progress.connect(
+                    self._update_clear_progress, Qt.QueuedConnection
+                )
+                self._clear_worker.finished.connect(self._clear_session_completed)
+                self._clear_worker.failed.connect(self._clear_session_failed)
+                self._clear_worker.finished.connect(self._clear_thread.quit)
+                self._clear_worker.failed.connect(self._clear_thread.quit)
 
-                progress.setValue(90)
-                progress.setLabelText("Reconnecting signals...")
-                QCoreApplication.processEvents()
+                self._clear_thread.started.connect(self._clear_worker.run)
+                self._clear_thread.finished.connect(self._clear_thread.deleteLater)
+                self._clear_thread.start()
 
-                # Reconnect signals
-                self.toolbar.samples_selected.connect(self.on_samples_selected)
-                self.toolbar.compound_selected.connect(self.on_compound_selected)
-                self.toolbar.compounds_deleted.connect(self.on_compounds_deleted)
+            except Exception as e:
+                self._clear_session_failed(str(e))
 
-                # Update menu states
-                self._update_menu_states()
+    def _update_clear_progress(self, current: int, total: int, operation: str):
+        """Map database clearing progress to 40-90% of the clear-session dialog."""
+        if self._clear_progress is None:
+            return
+        self._clear_progress.setValue(40 + current * 50 // total if total else 90)
+        self._clear_progress.setLabelText(operation)
 
-                progress.setValue(100)
-                progress.setLabelText("Session clearing complete")
-                QCoreApplication.processEvents()
+    def _clear_session_completed(self):
+        """Finish clear_session once the database has been cleared."""
+        progress = self._clear_progress
+        self._clear_progress = None
 
-                # Close progress dialog
-                progress.close()
+        self._clearing_session = False
+        progress.setValue(90)
+        progress.setLabelText("Updating menus...")
 
-                # Show success message
-                msg_box = self._create_message_box(
-                    "information",
-                    "Session Cleared",
-                    "All data has been cleared. You can now load new data.",
-                )
-                msg_box.exec()
+        # Update menu states
+        self._update_menu_states()
 
-                logger.info("Session cleared successfully")
+        progress.setValue(100)
+        progress.setLabelText("Session clearing complete")
 
-            except Exception as e:
-                # Close progress dialog
-                progress.close()
+        # Close progress dialog
+        progress.close()
 
-                # Ensure signals are reconnected even if clearing fails
-                try:
-                    self.toolbar.samples_selected.connect(self.on_samples_selected)
-                    self.toolbar.compound_selected.connect(self.on_compound_selected)
-                    self.toolbar.compounds_deleted.connect(self.on_compounds_deleted)
-                except Exception as ex:
-                    pass  # Signals might already be connected
-                    logger.error(f"{ex}")
-
-                logger.error(f"Failed to clear session: {e}")
-                msg_box = self._create_message_box(
-                    "critical",
-                    "Clear Session Failed",
-                    f"Failed to clear session: {str(e)}",
-                )
-                msg_box.exec()
+        # Show success message
+        msg_box = self._create_message_box(
+            "information",
+            "Session Cleared",
+            "All data has been cleared. You can now load new data.",
+        )
+        msg_box.exec()
+
+        logger.info("Session cleared successfully")
+
+    def _clear_session_failed(self, error_msg: str):
+        """Report a failed clear_session and re-enable the toolbar slots."""
+        # Close progress dialog
+        if self._clear_progress is not None:
+            self._clear_progress.close()
+            self._clear_progress = None
+
+        self._clearing_session = False
+
+        logger.error(f"Failed to clear session: {error_msg}")
+        msg_box = self._create_message_box(
+            "critical",
+            "Clear Session Failed",
+            f"Failed to clear session: {error_msg}",
+        )
+        msg_box.exec()
+
+    def _count_missing_corrections(self) -> int:
+        """
+        Count active labelled-compound EICs that have no active corrected row.
+
+        The join is only re-run when the read connection's
+        ``PRAGMA data_version`` changes, i.e. after any other connection has
+        committed to the database. Every write goes through get_connection(),
+        so this catches all imports, corrections and (soft) deletes in O(1).
+        """
+        conn = get_read_connection()
+
+        # Nothing can need correcting without an active labelled compound
+        if conn.execute(_SQL_ANY_LABELLED_COMPOUND).fetchone() is None:
+            return 0
+
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        cached = self._missing_corrections_cache
+        if cached is not None and cached[0] == data_version:
+            return cached[1]
+
+        missing = conn.execute(_SQL_MISSING_CORRECTIONS).fetchone()[0]
+
+        self._missing_corrections_cache = (data_version, missing)
+        return missing
 
     def toggle_natural_abundance_correction(self):
         """
@@ -2162,25 +2480,8 @@ class MainWindow(QMainWindow):
         # If enabling correction, check if corrections need to be applied
         if is_enabled:
             try:
-                from manic.models.database import get_connection
-                from manic.processors.eic_correction_manager import (
-                    process_all_corrections,
-                )
-
                 # Check if there are raw EICs that don't have corresponding corrected data
-                with get_connection() as conn:
-                    missing_corrections_count = conn.execute("""
-                        SELECT COUNT(*)
-                        FROM eic e
-                        JOIN compounds c ON e.compound_name = c.compound_name
-                        LEFT JOIN eic_corrected ec
-                           ON ec.sample_name = e.sample_name
-                          AND ec.compound_name = e.compound_name
-                        WHERE e.deleted = 0
-                          AND c.deleted = 0
-                          AND c.label_atoms > 0
-                          AND (ec.id IS NULL OR ec.deleted = 1)
-                    """).fetchone()[0]
+                missing_corrections_count = self._count_missing_corrections()
 
                 # If we have raw EICs without corrected data, apply corrections
                 if missing_corrections_count > 0:
@@ -2188,36 +2489,10 @@ class MainWindow(QMainWindow):
                         f"Applying natural abundance corrections for {missing_corrections_count} EICs..."
                     )
 
-                    # Show progress dialog (no cancel button)
-                    from PySide6.QtCore import Qt
-                    from PySide6.QtWidgets import QProgressDialog
-
-                    progress_dialog = QProgressDialog(
-                        "Applying natural abundance corrections...", "", 0, 100, self
-                    )
-                    progress_dialog.setWindowTitle("Natural Abundance Correction")
-                    progress_dialog.setWindowModality(Qt.WindowModal)
-                    progress_dialog.setCancelButton(None)
-                    progress_dialog.show()
-
-                    def correction_progress(current, total):
-                        if total > 0:
-                            progress_value = int((current / total) * 100)
-                            progress_dialog.setValue(progress_value)
-
-                    try:
-                        corrections_count = process_all_corrections(
-                            progress_cb=correction_progress
-                        )
-                        logger.info(
-                            f"Applied {corrections_count} natural abundance corrections"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to apply natural abundance corrections: {e}"
-                        )
-                    finally:
-                        progress_dialog.close()
+                    # The corrections run on the thread pool; the replot
+                    # happens once they report back
+                    self._apply_corrections_in_background()
+                    return
 
             except Exception as e:
                 logger.error(
@@ -2225,6 +2500,44 @@ class MainWindow(QMainWindow):
                 )
 
         # If we have data displayed, refresh everything
+        self._replot_current_selection()
+
+    def _apply_corrections_in_background(self):
+        """Run process_all_corrections on the thread pool, then replot."""
+        # Show progress dialog (no cancel button)
+        progress_dialog = QProgressDialog(
+            "Applying natural abundance corrections...", "", 0, 100, self
+        )
+        progress_dialog.setWindowTitle("Natural Abundance Correction")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setCancelButton(None)
+
+        worker = Worker(process_all_corrections, progress_callback=True)
+
+        def on_done(corrections_count):
+            self._corrections_worker = None
+            progress_dialog.close()
+            logger.info(f"Applied {corrections_count} natural abundance corrections")
+            self._replot_current_selection()
+
+        def on_failed(error_msg):
+            self._corrections_worker = None
+            progress_dialog.close()
+            logger.error(f"Failed to apply natural abundance corrections: {error_msg}")
+            self._replot_current_selection()
+
+        worker.signals.progress.connect(progress_dialog.setValue, Qt.QueuedConnection)
+        worker.signals.finished.connect(on_done)
+        worker.signals.failed.connect(on_failed)
+
+        # Keep the runnable (and its signals) alive until it reports back
+        self._corrections_worker = worker
+        progress_dialog.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def _replot_current_selection(self):
+        """Replot the main graphs if a compound and samples are selected."""
         selected_compound = self.toolbar.get_selected_compound()
         selected_samples = self.toolbar.get_selected_samples()
 
@@ -2237,6 +2550,10 @@ class MainWindow(QMainWindow):
         is_enabled = self.legacy_integration_toggle.isChecked()
         self.use_legacy_integration = is_enabled
 
+        # Keep the validation provider in the same integration mode as the GUI;
+        # this drops its cached areas only when the mode actually changes.
+        self._validation_provider.set_use_legacy_integration(is_enabled)
+
         logger.info(f"Legacy integration mode toggled: {'ON' if is_enabled else 'OFF'}")
 
         # Update menu text
@@ -2256,16 +2573,8 @@ class MainWindow(QMainWindow):
         )
         msg.exec()
 
-        # Also update the graph view to use corrected/uncorrected data
-        self.graph_view.set_use_corrected(is_enabled)
-
         # If we have data displayed, refresh everything
-        selected_compound = self.toolbar.get_selected_compound()
-        selected_samples = self.toolbar.get_selected_samples()
-
-        if selected_compound and selected_samples:
-            # Trigger a full replot of the main graphs
-            self.on_plot_button(selected_compound, selected_samples)
+        self._replot_current_selection()
 
     def _ensure_corrections_applied_for_export(self):
         """
@@ -2282,24 +2591,8 @@ class MainWindow(QMainWindow):
         - Original raw data is never modified
         """
         try:
-            from manic.models.database import get_connection
-            from manic.processors.eic_correction_manager import process_all_corrections
-
             # Check if there are any labeled compounds that lack corrected data
-            with get_connection() as conn:
-                missing_corrections_count = conn.execute("""
-                    SELECT COUNT(*)
-                    FROM eic e
-                    JOIN compounds c ON e.compound_name = c.compound_name
-                    LEFT JOIN eic_corrected ec
-                       ON ec.sample_name = e.sample_name
-                      AND ec.compound_name = e.compound_name
-                      AND ec.deleted = 0
-                    WHERE e.deleted = 0
-                      AND c.deleted = 0
-                      AND c.label_atoms > 0
-                      AND ec.id IS NULL
-                """).fetchone()[0]
+            missing_corrections_count = self._count_missing_corrections()
 
             # If corrections are missing, apply them silently
             if missing_corrections_count > 0:
@@ -2328,13 +2621,47 @@ class MainWindow(QMainWindow):
                 "error",
                 "Export Preparation Failed",
                 "Failed to prepare corrected data for export.",
-                f"Error: {str(e)}\n\n"
+                f"Error: {e}\n\n"
                 "The export cannot proceed without properly corrected data. "
                 "Please check the logs for details.",
             )
             msg.exec()
             raise  # Prevent export from continuing
 
+    def _build_export_options_dialog(self) -> QDialog:
+        """Build the export options dialog; its inputs are kept on self."""
+        options_dialog = QDialog(self)
+        options_dialog.setWindowTitle("Export Options")
+        vbox = QVBoxLayout(options_dialog)
+        info_label = QLabel(
+            "Choose integration method for this export (can also be changed in Settings → Legacy Integration Mode):"
+        )
+        vbox.addWidget(info_label)
+        # Force black text for label, radio buttons, and checkboxes regardless of theme
+        options_dialog.setStyleSheet("QLabel, QRadioButton, QCheckBox { color: black; }")
+
+        radio_time = QRadioButton("Time-based (recommended)")
+        radio_legacy = QRadioButton("Legacy (MATLAB-compatible unit spacing)")
+        vbox.addWidget(radio_time)
+        vbox.addWidget(radio_legacy)
+
+        # Optional sheets section
+        vbox.addSpacing(10)
+        optional_label = QLabel("Optional sheets:")
+        vbox.addWidget(optional_label)
+        checkbox_carbon_enrichment = QCheckBox("Include % Carbons Labelled sheet")
+        vbox.addWidget(checkbox_carbon_enrichment)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        vbox.addWidget(buttons)
+        buttons.accepted.connect(options_dialog.accept)
+        buttons.rejected.connect(options_dialog.reject)
+
+        self._export_radio_time = radio_time
+        self._export_radio_legacy = radio_legacy
+        self._export_carbon_checkbox = checkbox_carbon_enrichment
+        return options_dialog
+
     def export_data(self):
         """
         Export processed data to Excel with 6 worksheets.
@@ -2373,50 +2700,26 @@ class MainWindow(QMainWindow):
             # This is independent of the UI visualization toggle state
             self._ensure_corrections_applied_for_export()
 
-            # Export options popup: choose integration mode
-            options_dialog = QDialog(self)
-            options_dialog.setWindowTitle("Export Options")
-            vbox = QVBoxLayout(options_dialog)
-            info_label = QLabel(
-                "Choose integration method for this export (can also be changed in Settings → Legacy Integration Mode):"
-            )
-            vbox.addWidget(info_label)
-            # Force black text for label, radio buttons, and checkboxes regardless of theme
-            options_dialog.setStyleSheet(
-                "QLabel, QRadioButton, QCheckBox { color: black; }"
-            )
-
-            radio_time = QRadioButton("Time-based (recommended)")
-            radio_legacy = QRadioButton("Legacy (MATLAB-compatible unit spacing)")
-            vbox.addWidget(radio_time)
-            vbox.addWidget(radio_legacy)
+            # Export options popup: choose integration mode. Built on first
+            # export and reused; only the defaults are re-seeded
+            if self._export_options_dialog is None:
+                self._export_options_dialog = self._build_export_options_dialog()
 
             # Default selection depends on current settings toggle
             if self.use_legacy_integration:
-                radio_legacy.setChecked(True)
+                self._export_radio_legacy.setChecked(True)
             else:
-                radio_time.setChecked(True)
-
-            # Optional sheets section
-            vbox.addSpacing(10)
-            optional_label = QLabel("Optional sheets:")
-            vbox.addWidget(optional_label)
-            checkbox_carbon_enrichment = QCheckBox("Include % Carbons Labelled sheet")
-            checkbox_carbon_enrichment.setChecked(False)  # Off by default
-            vbox.addWidget(checkbox_carbon_enrichment)
-
-            buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-            vbox.addWidget(buttons)
-            buttons.accepted.connect(options_dialog.accept)
-            buttons.rejected.connect(options_dialog.reject)
-
-            if options_dialog.exec() != QDialog.Accepted:
+                self._export_radio_time.setChecked(True)
+            self._export_carbon_checkbox.setChecked(False)  # Off by default
+
+            if self._export_options_dialog.exec() != QDialog.Accepted:
                 return  # user cancelled
 
             # Read selection and persist to window state
-            chosen_use_legacy = radio_legacy.isChecked()
+            chosen_use_legacy = self._export_radio_legacy.isChecked()
             self.use_legacy_integration = chosen_use_legacy
-            include_carbon_enrichment = checkbox_carbon_enrichment.isChecked()
+            self._validation_provider.set_use_legacy_integration(chosen_use_legacy)
+            include_carbon_enrichment = self._export_carbon_checkbox.isChecked()
 
             # Get current internal standard selection from toolbar
             internal_standard = self.toolbar.get_internal_standard()
@@ -2473,10 +2776,16 @@ class MainWindow(QMainWindow):
                 self.internal_standard_reference_isotope
             )
 
-            # Progress callback function
+            # Progress callback function; the sheet writers report the same
+            # percentage many times, so only repaint when it moves
+            last_value = -1
+
             def update_progress(value):
-                progress_dialog.setValue(value)
-                QCoreApplication.processEvents()  # Keep UI responsive
+                nonlocal last_value
+                if value != last_value:
+                    last_value = value
+                    progress_dialog.setValue(value)
+                    QCoreApplication.processEvents()  # Keep UI responsive
                 return not progress_dialog.wasCanceled()  # Return False if cancelled
 
             # Show progress dialog
@@ -2535,6 +2844,6 @@ class MainWindow(QMainWindow):
             msg_box = self._create_message_box(
                 "critical",
                 "Export Error",
-                f"An error occurred during data export:\n{str(e)}",
+                f"An error occurred during data export:\n{e}",
             )
             msg_box.exec()
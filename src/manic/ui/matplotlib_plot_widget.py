@@ -7,7 +7,11 @@ Key features include custom zoom controls, responsive layouts, and
 efficient batch rendering for improved performance.
 """
 
+import functools
 import logging
+import os
+import re
+import sys
 from contextlib import contextmanager
 
 # Configure matplotlib for Qt5 integration with performance optimizations
@@ -16,7 +20,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
+from matplotlib.ticker import FormatStrFormatter, ScalarFormatter
 from PySide6.QtWidgets import QHBoxLayout, QToolButton, QVBoxLayout, QWidget
 
 from manic.constants import (
@@ -49,7 +56,17 @@ from manic.constants import (
     TOOLBAR_SPACING,
 )
 
-matplotlib.use("Qt5Agg")
+# The widget creates its Qt canvas directly, so pyplot's backend only needs
+# to be interactive when there is a display to show figures on; headless
+# sessions (offscreen Qt, no X/Wayland) fall back to plain Agg
+if os.environ.get("QT_QPA_PLATFORM") != "offscreen" and (
+    sys.platform in ("darwin", "win32")
+    or os.environ.get("DISPLAY")
+    or os.environ.get("WAYLAND_DISPLAY")
+):
+    matplotlib.use("Qt5Agg")
+else:
+    matplotlib.use("Agg")
 # Configure matplotlib rendering parameters for optimal performance
 matplotlib.rcParams["figure.dpi"] = PLOT_DPI  # Optimized DPI for responsive rendering
 matplotlib.rcParams["figure.autolayout"] = (
@@ -60,6 +77,92 @@ matplotlib.rcParams["axes.unicode_minus"] = False  # Simplified minus sign rende
 
 logger = logging.getLogger(__name__)
 
+_RGBA_RE = re.compile(r"rgba\((\d+),(\d+),(\d+),([\d.]+)\)")
+
+
+def _decimate_minmax(x_data: np.ndarray, y_data: np.ndarray, n_bins: int):
+    """
+    Reduce a dense trace to the min and max point of each of ``n_bins``
+    consecutive index buckets, kept in their original order.
+
+    With one bucket per pixel column across the x range being shown, the
+    rendered line is visually identical to the full trace, but matplotlib
+    only transforms and strokes ~2 points per column. The envelope is only
+    exact for that range: a zoomed view needs its own, which is why the plot
+    widget re-decimates the visible range whenever the x limits change. The
+    first and last points are always kept so the x-range, and with it the
+    autoscaled limits, are unchanged.
+    """
+    n = len(y_data)
+    size = -(-n // n_bins)  # ceil division
+    if size < 3:
+        return x_data, y_data
+
+    # Whole buckets are reshaped so argmin/argmax run as single C loops
+    full = (n // size) * size
+    buckets = y_data[:full].reshape(-1, size)
+    offsets = np.arange(0, full, size)
+    picks = [offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1)]
+    if full < n:
+        tail = y_data[full:]
+        picks.append(np.array([full + tail.argmin(), full + tail.argmax()]))
+    picks.append(np.array([0, n - 1]))
+
+    index = np.unique(np.concatenate(picks))  # sorted, duplicates dropped
+    return x_data[index], y_data[index]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color(color: str):
+    """
+    Convert an ``rgba(r,g,b,a)`` string to a matplotlib RGBA tuple.
+
+    Hex, named and already-parsed colours are returned unchanged; matplotlib
+    handles them natively. Callers reuse a handful of colour strings, so
+    results are cached.
+    """
+    if isinstance(color, str) and color.startswith("rgba"):
+        match = _RGBA_RE.match(color)
+        if match:
+            r, g, b, a = match.groups()
+            return (int(r) / 255, int(g) / 255, int(b) / 255, float(a))
+    return color
+
+
+def _as_float(data) -> np.ndarray:
+    """
+    Return *data* as a float array, keeping float32 input as float32.
+
+    Agg renders in single precision anyway, so upcasting float32 traces to
+    float64 would only double the bytes copied.
+    """
+    data = np.asarray(data)
+    if data.dtype in (np.float32, np.float64):
+        return data
+    return data.astype(np.float64, copy=False)
+
+
+def _finite_xy(x_data: np.ndarray, y_data: np.ndarray, positive_y: bool = False):
+    """
+    Drop points where x or y is not finite (or y <= 0 when ``positive_y``).
+
+    Clean input, the common case, is returned as-is without building a mask
+    or copying: a sum propagates NaN/inf in a single pass, and an overflow
+    to inf only falls through to the exact masked path below.
+    """
+    if x_data.size == 0 or y_data.size == 0:
+        return x_data, y_data
+    with np.errstate(invalid="ignore", over="ignore"):
+        clean = np.isfinite(x_data.sum() + y_data.sum())
+    if clean and (not positive_y or y_data.min() > 0):
+        return x_data, y_data
+
+    mask = np.isfinite(x_data)
+    np.logical_and(mask, np.isfinite(y_data), out=mask)
+    if positive_y:
+        np.logical_and(mask, y_data > 0, out=mask)
+    return x_data[mask], y_data[mask]
+
 
 @contextmanager
 def matplotlib_cleanup():
@@ -67,11 +170,8 @@ def matplotlib_cleanup():
     try:
         yield
     finally:
-        # Force garbage collection of matplotlib objects
-        import gc
-
-        gc.collect()
-        # Close any lingering figures
+        # Close any lingering figures; the cyclic collector reclaims them in
+        # its own time, so no full gc.collect() pause is forced here
         plt.close("all")
 
 
@@ -82,14 +182,50 @@ class CompactNavigationToolbar(QWidget):
     with zoom, pan, and reset functionality.
     """
 
+    # Clean white background, with consistent button styling for hover and
+    # toggle states; the button rules come last so they override the
+    # background
+    _STYLE_SHEET = f"""
+        QWidget {{
+            background-color: white;
+        }}
+        QToolButton {{
+            border: none;
+            padding: {TOOLBAR_BUTTON_PADDING}px;
+            margin: {TOOLBAR_BUTTON_MARGIN}px;
+            background-color: transparent;
+            border-radius: 3px;
+            color: black;
+        }}
+        QToolButton:hover {{
+            background-color: rgba(0, 0, 0, {BUTTON_HOVER_OPACITY});
+        }}
+        QToolButton:pressed {{
+            background-color: rgba(0, 0, 0, {BUTTON_PRESSED_OPACITY});
+        }}
+        QToolButton:checked {{
+            background-color: rgba(0, 120, 215, 0.2);
+            border: 1px solid rgba(0, 120, 215, {BUTTON_CHECKED_BORDER_OPACITY});
+        }}
+    """
+
     def __init__(self, canvas, parent=None):
         super().__init__(parent)
         self.canvas = canvas
-        self.toolbar = NavigationToolbar(canvas, self)
-        self.toolbar.setVisible(False)  # Hide the original toolbar
+        # The hidden matplotlib toolbar that implements pan/zoom is built on
+        # first use; most plots are never panned or zoomed
+        self._nav_toolbar = None
 
         self._setup_ui()
 
+    @property
+    def toolbar(self):
+        """Hidden NavigationToolbar2QT driving pan and zoom, built on demand."""
+        if self._nav_toolbar is None:
+            self._nav_toolbar = NavigationToolbar(self.canvas, self)
+            self._nav_toolbar.setVisible(False)  # Hide the original toolbar
+        return self._nav_toolbar
+
     def _setup_ui(self):
         """Create a compact toolbar with essential buttons."""
         layout = QHBoxLayout(self)
@@ -98,37 +234,15 @@ class CompactNavigationToolbar(QWidget):
         )
         layout.setSpacing(TOOLBAR_SPACING)
 
-        # Configure toolbar with clean white background
-        self.setStyleSheet("background-color: white;")
-
-        # Define consistent button styling with hover and toggle states
-        button_style = f"""
-            QToolButton {{
-                border: none;
-                padding: {TOOLBAR_BUTTON_PADDING}px;
-                margin: {TOOLBAR_BUTTON_MARGIN}px;
-                background-color: transparent;
-                border-radius: 3px;
-                color: black;
-            }}
-            QToolButton:hover {{
-                background-color: rgba(0, 0, 0, {BUTTON_HOVER_OPACITY});
-            }}
-            QToolButton:pressed {{
-                background-color: rgba(0, 0, 0, {BUTTON_PRESSED_OPACITY});
-            }}
-            QToolButton:checked {{
-                background-color: rgba(0, 120, 215, 0.2);
-                border: 1px solid rgba(0, 120, 215, {BUTTON_CHECKED_BORDER_OPACITY});
-            }}
-        """
+        # White toolbar and button styling, parsed once and inherited by the
+        # buttons
+        self.setStyleSheet(self._STYLE_SHEET)
 
         # Reset button: returns plot to a deterministic data-fitted view state
         self.home_btn = QToolButton()
         self.home_btn.setText("↻")  # Circular arrow for reset
         self.home_btn.setToolTip("Reset view")
         self.home_btn.clicked.connect(self._reset_view)
-        self.home_btn.setStyleSheet(button_style)
         layout.addWidget(self.home_btn)
 
         # Drag button: enables plot panning functionality
@@ -137,7 +251,6 @@ class CompactNavigationToolbar(QWidget):
         self.pan_btn.setToolTip("Drag")
         self.pan_btn.setCheckable(True)
         self.pan_btn.clicked.connect(self._on_pan)
-        self.pan_btn.setStyleSheet(button_style)
         layout.addWidget(self.pan_btn)
 
         # Zoom button: activates rectangular zoom selection
@@ -146,7 +259,6 @@ class CompactNavigationToolbar(QWidget):
         self.zoom_btn.setToolTip("Zoom to rectangle")
         self.zoom_btn.setCheckable(True)
         self.zoom_btn.clicked.connect(self._on_zoom)
-        self.zoom_btn.setStyleSheet(button_style)
         layout.addWidget(self.zoom_btn)
 
         layout.addStretch()
@@ -158,17 +270,37 @@ class CompactNavigationToolbar(QWidget):
         """Toggle plot panning mode with exclusive button state management."""
         if self.pan_btn.isChecked():
             self.zoom_btn.setChecked(False)
-            self.toolbar.pan()
-        else:
-            self.toolbar.pan()  # Toggle off
+        self._sync_mode()
 
     def _on_zoom(self):
         """Toggle rectangular zoom mode with exclusive button state management."""
         if self.zoom_btn.isChecked():
             self.pan_btn.setChecked(False)
-            self.toolbar.zoom()
+        self._sync_mode()
+
+    def _sync_mode(self):
+        """
+        Bring the matplotlib toolbar's mode in line with the buttons.
+
+        pan()/zoom() toggle, and each call swaps cursors and event handlers
+        on the canvas, so they are only called when the mode has to change.
+        """
+        if self.pan_btn.isChecked():
+            wanted = "pan/zoom"
+        elif self.zoom_btn.isChecked():
+            wanted = "zoom rect"
+        elif self._nav_toolbar is None:
+            return  # Never activated, nothing to switch off
         else:
-            self.toolbar.zoom()  # Toggle off
+            wanted = ""
+
+        mode = self.toolbar.mode
+        if mode == wanted:
+            return
+        if wanted == "pan/zoom" or (not wanted and mode == "pan/zoom"):
+            self.toolbar.pan()
+        else:
+            self.toolbar.zoom()
 
     def _reset_view(self):
         """Reset to a fit-to-data view.
@@ -178,12 +310,9 @@ class CompactNavigationToolbar(QWidget):
         """
         try:
             # Turn off active modes first
-            if self.pan_btn.isChecked():
-                self.pan_btn.setChecked(False)
-                self.toolbar.pan()
-            if self.zoom_btn.isChecked():
-                self.zoom_btn.setChecked(False)
-                self.toolbar.zoom()
+            self.pan_btn.setChecked(False)
+            self.zoom_btn.setChecked(False)
+            self._sync_mode()
 
             fig = getattr(self.canvas, "figure", None)
             if fig is None or not fig.axes:
@@ -206,17 +335,7 @@ class CompactNavigationToolbar(QWidget):
                 y_max = float(np.max(y_data))
                 ax.set_ylim(0.0, y_max * 1.1 if y_max > 0 else 1.0)
             elif data_lines:
-                all_x = []
-                all_y = []
-                for x_vals, y_vals in data_lines:
-                    if x_vals is None or y_vals is None or len(x_vals) == 0:
-                        continue
-                    all_x.append(np.asarray(x_vals, dtype=np.float64))
-                    all_y.append(np.asarray(y_vals, dtype=np.float64))
-                if not all_x or not all_y:
-                    return
-                x_concat = np.concatenate(all_x)
-                y_concat = np.concatenate(all_y)
+                x_concat, y_concat = self.parent().all_line_data()
                 x_min = float(np.min(x_concat))
                 x_max = float(np.max(x_concat))
                 y_min = float(np.min(y_concat))
@@ -231,12 +350,11 @@ class CompactNavigationToolbar(QWidget):
 
             self.canvas.draw_idle()
         except Exception as e:
-            logger.error(f"Failed to reset view: {e}")
+            logger.error("Failed to reset view: %s", e)
 
     def cleanup(self):
         """Cleanup toolbar resources."""
-        if hasattr(self, "toolbar") and self.toolbar:
-            self.toolbar = None
+        self._nav_toolbar = None
 
 
 class MatplotlibPlotWidget(QWidget):
@@ -251,6 +369,10 @@ class MatplotlibPlotWidget(QWidget):
     - Responsive layout adaptation
     """
 
+    # FormatStrFormatter never consults its axis, so one instance can be
+    # shared by every time axis
+    _TIME_FORMATTER = FormatStrFormatter("%.2f")
+
     def __init__(
         self, title: str = "", x_label: str = "", y_label: str = "", parent=None
     ):
@@ -261,7 +383,25 @@ class MatplotlibPlotWidget(QWidget):
 
         # Initialize data storage for plot management
         self.data_lines = []
+        # Named series -> (Line2D, index into data_lines), for in-place updates
+        self._lines = {}
+        # data_lines concatenated into single x and y arrays, built on demand
+        self._all_line_data = None
+        # Decimated lines -> (x, y, coarse envelope, plotted index window);
+        # the visible part is re-decimated from x, y whenever the x view moves
+        self._dense_lines = {}
         self._last_stem_data = None
+        # Vertical guides share one LineCollection; _vline_specs holds the
+        # (x, rgba, width, linestyle) of each so the collection can be rebuilt
+        self._vlines = None
+        self._vline_specs = []
+
+        # Canvas pixels from the last full draw, and the artists blitted on
+        # top of it since; lets guides added after a draw skip a full redraw
+        self._background = None
+        self._blit_artists = []
+        # Nesting depth of batch_updates(); draws are held while > 0
+        self._draw_depth = 0
 
         self._setup_ui()
 
@@ -282,9 +422,6 @@ class MatplotlibPlotWidget(QWidget):
             facecolor="white",
             edgecolor="white",
         )
-        self.canvas = FigureCanvas(self.figure)
-        # Ensure canvas maintains consistent white background
-        self.canvas.setStyleSheet("background-color: white; border: none;")
 
         # Configure subplot with optimized margin parameters
         self.ax = self.figure.add_subplot(111, facecolor="white")
@@ -314,6 +451,32 @@ class MatplotlibPlotWidget(QWidget):
         )
         self.ax.tick_params(labelsize=PLOT_TICK_FONTSIZE)
 
+        # Large intensities switch to scientific notation by themselves once
+        # the tick values reach the threshold, with no per-plot reconfiguration
+        y_formatter = ScalarFormatter(useMathText=True)
+        y_formatter.set_powerlimits(
+            (
+                matplotlib.rcParams["axes.formatter.limits"][0],
+                int(np.log10(SCIENTIFIC_NOTATION_THRESHOLD)),
+            )
+        )
+        self.ax.yaxis.set_major_formatter(y_formatter)
+        self.ax.yaxis.get_offset_text().set_fontsize(8)
+
+        # Attach the Qt canvas only once the figure is fully styled; nothing
+        # is rendered until the widget is first painted
+        self.canvas = FigureCanvas(self.figure)
+        # Ensure canvas maintains consistent white background
+        self.canvas.setStyleSheet("background-color: white; border: none;")
+        # Every full draw (including resizes, pans and zooms) refreshes the
+        # cached background used for blitting
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        # A resized canvas has a new pixel buffer; the old background must
+        # not be blitted onto it before the redraw that follows
+        self.canvas.mpl_connect("resize_event", self._invalidate_background)
+        # Zoom, pan and reset all go through set_xlim
+        self.ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
         # Integrate custom navigation toolbar
         self.toolbar = CompactNavigationToolbar(self.canvas, self)
 
@@ -324,26 +487,77 @@ class MatplotlibPlotWidget(QWidget):
         # Define minimum widget dimensions
         self.setMinimumHeight(PLOT_MIN_HEIGHT)
 
+    def _on_draw(self, event):
+        """Cache the freshly drawn canvas as the blitting background."""
+        # savefig draws through a temporary canvas; only cache our own pixels
+        if self.figure.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._blit_artists = []
+
+    def _invalidate_background(self, event=None):
+        """Drop the cached background until the next full draw."""
+        self._background = None
+        self._blit_artists = []
+
+    def _blit_artist(self, artist):
+        """
+        Show an artist added after the last full draw without redrawing
+        everything: restore the cached background and paint only the artists
+        added since. Before the first draw (or after clear_plot) this is a
+        no-op and the artist appears with the next finalize_plot.
+        """
+        if self._background is None or self._draw_depth:
+            return
+        if artist not in self._blit_artists:
+            self._blit_artists.append(artist)
+        self.canvas.restore_region(self._background)
+        for blitted in self._blit_artists:
+            self.ax.draw_artist(blitted)
+        # Blitted artists are clipped to the axes, so only that area of the
+        # widget needs repainting
+        self.canvas.blit(self.ax.bbox)
+
+    def _pixel_columns(self) -> int:
+        """
+        Device-pixel width of the screen, an upper bound on the horizontal
+        resolution of the axes at any window size, so resizing never needs a
+        finer envelope. Zooming does, and is handled by _on_xlim_changed.
+        """
+        screen = self.screen()
+        if screen is None:
+            return 2000
+        return int(screen.size().width() * screen.devicePixelRatio())
+
     def clear_plot(self):
         """Clear all data from the plot."""
-        self.ax.clear()
+        # Remove only the data artists; ax.clear() would also rebuild the
+        # axis, ticks and spines and force all the styling to be re-applied
+        for artist in (
+            *self.ax.lines,
+            *self.ax.collections,
+            *self.ax.patches,
+            *self.ax.texts,
+            *self.ax.images,
+        ):
+            artist.remove()
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
         self.data_lines = []
-        self.ax.set_facecolor("white")
+        self._lines = {}
+        self._all_line_data = None
+        self._dense_lines = {}
+        self._vlines = None
+        self._vline_specs = []
+        # Forget the old data limits and any zoom so the next plot autoscales
+        self.ax.relim()
+        self.ax.set_autoscale_on(True)
+        # The cached pixels show the old data
+        self._invalidate_background()
         self.ax.set_title(
             self.title, fontsize=PLOT_TITLE_FONTSIZE, pad=PLOT_TITLE_PADDING
         )
-        self.ax.set_xlabel(self.x_label, fontsize=PLOT_LABEL_FONTSIZE)
-        self.ax.set_ylabel(self.y_label, fontsize=PLOT_LABEL_FONTSIZE)
-        self.ax.grid(
-            True, alpha=PLOT_GRID_ALPHA, linestyle="-", linewidth=PLOT_GRID_LINEWIDTH
-        )
-        self.ax.tick_params(labelsize=PLOT_TICK_FONTSIZE)
-
-        # Restore axis styling configuration
-        self.ax.spines["top"].set_visible(False)
-        self.ax.spines["right"].set_visible(False)
-        self.ax.spines["left"].set_linewidth(PLOT_AXIS_SPINE_WIDTH)
-        self.ax.spines["bottom"].set_linewidth(PLOT_AXIS_SPINE_WIDTH)
         # Defer rendering until data is loaded
 
     def plot_line(
@@ -368,56 +582,183 @@ class MatplotlibPlotWidget(QWidget):
         """
         try:
             # Ensure data is in numpy array format
-            x_data = np.asarray(x_data, dtype=np.float64)
-            y_data = np.asarray(y_data, dtype=np.float64)
+            x_data = _as_float(x_data)
+            y_data = _as_float(y_data)
 
             # Remove invalid data points
-            mask = np.isfinite(x_data) & np.isfinite(y_data)
-            x_data = x_data[mask]
-            y_data = y_data[mask]
+            x_data, y_data = _finite_xy(x_data, y_data)
 
             if len(x_data) == 0:
-                logger.warning(f"No valid data to plot for '{name}'")
+                logger.warning("No valid data to plot for '%s'", name)
                 return
 
-            # Store data for later reference
-            self.data_lines.append((x_data, y_data))
-
             # Parse RGBA color format if provided
-            if color.startswith("rgba"):
-                import re
-
-                match = re.match(r"rgba\((\d+),(\d+),(\d+),([\d.]+)\)", color)
-                if match:
-                    r, g, b, a = match.groups()
-                    color = (int(r) / 255, int(g) / 255, int(b) / 255, float(a))
-            elif color.startswith("#"):
-                # Convert hex to matplotlib format
-                pass  # matplotlib handles hex colors natively
-
-            # Plot the line
-            self.ax.plot(
-                x_data,
-                y_data,
-                color=color,
-                linewidth=width,
-                linestyle=style,
-                label=name if name else None,
-            )[0]
-
-            # Update axes limits
-            self.ax.relim()
-            self.ax.autoscale_view()
-
-            # Use scientific notation for large numbers
-            if np.max(np.abs(y_data)) > SCIENTIFIC_NOTATION_THRESHOLD:
-                self.ax.ticklabel_format(axis="y", style="scientific", scilimits=(0, 0))
-                self.ax.yaxis.get_offset_text().set_fontsize(8)
+            color = _parse_color(color)
+
+            # Dense traces are drawn from a per-pixel-column min/max envelope;
+            # data_lines keeps the full arrays. Time traces are sorted, which
+            # lets _on_xlim_changed re-decimate just the visible range
+            plot_x, plot_y = x_data, y_data
+            columns = self._pixel_columns()
+            dense = len(x_data) > 2 * columns and not np.any(np.diff(x_data) < 0)
+            if dense:
+                coarse = _decimate_minmax(x_data, y_data, columns)
+                plot_x, plot_y = coarse
+
+            if name and name in self._lines:
+                # Re-plotting a named series updates its artist in place
+                line, index = self._lines[name]
+                self._dense_lines.pop(line, None)
+                if dense:
+                    self._dense_lines[line] = (x_data, y_data, coarse, None)
+                    plot_x, plot_y = self._visible_trace(line)
+                line.set_data(plot_x, plot_y)
+                line.set_color(color)
+                line.set_linewidth(width)
+                line.set_linestyle(style)
+                self.data_lines[index] = (x_data, y_data)
+                self._all_line_data = None
+                # The new data may cover less than the old, so recompute the
+                # data limits from scratch
+                self.ax.relim()
+                self._update_vline_limits()
+                self.ax.autoscale_view()
+            else:
+                # Plot the line
+                line = self.ax.plot(
+                    plot_x,
+                    plot_y,
+                    color=color,
+                    linewidth=width,
+                    linestyle=style,
+                    label=name if name else None,
+                )[0]
+                if dense:
+                    # Drawn as the full-range envelope until the view narrows
+                    self._dense_lines[line] = (x_data, y_data, coarse, None)
+                # Store data for later reference
+                self.data_lines.append((x_data, y_data))
+                self._all_line_data = None
+                if name:
+                    self._lines[name] = (line, len(self.data_lines) - 1)
+
+            # Axes limits need no work here: ax.plot grows the data limits by
+            # the new line's extent and matplotlib autoscales the view lazily
+            # at draw time, so relim/autoscale_view per line only re-walked
+            # every artist
 
             # Defer canvas update for batch rendering
 
         except Exception as e:
-            logger.error(f"Failed to plot line: {e}")
+            logger.error("Failed to plot line: %s", e)
+
+    def all_line_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        All plotted line data as two contiguous arrays (x, y).
+
+        Built with one concatenate per axis the first time it is needed after
+        a change, then cached until the next plot_line or clear_plot.
+        """
+        if self._all_line_data is None:
+            if self.data_lines:
+                xs, ys = zip(*self.data_lines)
+                self._all_line_data = (np.concatenate(xs), np.concatenate(ys))
+            else:
+                self._all_line_data = (np.empty(0), np.empty(0))
+        return self._all_line_data
+
+    def _view_window(self, x_data: np.ndarray) -> tuple[int, int]:
+        """
+        Index range of the sorted ``x_data`` inside the current x view, plus
+        one sample either side so the line runs off the edges of the axes.
+        """
+        lo, hi = sorted(self.ax.get_xlim())
+        start = max(int(np.searchsorted(x_data, lo)) - 1, 0)
+        stop = min(int(np.searchsorted(x_data, hi, side="right")) + 1, len(x_data))
+        return start, stop
+
+    def _visible_trace(self, line) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Points to draw for a decimated line at the current x view.
+
+        The visible range is re-decimated from the full arrays, so zooming in
+        far enough shows every sample. Outside it the full-range envelope is
+        kept, which leaves the line's data limits (and autoscaling) unchanged.
+        """
+        x_data, y_data, (coarse_x, coarse_y), _ = self._dense_lines[line]
+        start, stop = self._view_window(x_data)
+        self._dense_lines[line] = (x_data, y_data, (coarse_x, coarse_y), (start, stop))
+        if start == 0 and stop == len(x_data):
+            return coarse_x, coarse_y
+
+        seg_x, seg_y = x_data[start:stop], y_data[start:stop]
+        columns = self._pixel_columns()
+        if len(seg_x) > 2 * columns:
+            seg_x, seg_y = _decimate_minmax(seg_x, seg_y, columns)
+        left = coarse_x < x_data[start]
+        right = coarse_x > x_data[stop - 1]
+        return (
+            np.concatenate((coarse_x[left], seg_x, coarse_x[right])),
+            np.concatenate((coarse_y[left], seg_y, coarse_y[right])),
+        )
+
+    def _on_xlim_changed(self, ax):
+        """Redraw decimated lines at the resolution of the new x view."""
+        for line, (x_data, _, _, window) in list(self._dense_lines.items()):
+            if self._view_window(x_data) == window:
+                continue  # Same samples in view, e.g. a pan within one sample
+            line.set_data(*self._visible_trace(line))
+
+    def update_line(self, name: str, x_data: np.ndarray, y_data: np.ndarray) -> bool:
+        """
+        Replace the data of an existing named series, keeping its styling.
+
+        Returns False if no series called *name* is on the plot. Like
+        plot_line, the change is shown by the next finalize_plot.
+        """
+        if name not in self._lines:
+            return False
+        line, _ = self._lines[name]
+        self.plot_line(
+            x_data,
+            y_data,
+            color=line.get_color(),
+            width=line.get_linewidth(),
+            name=name,
+            style=line.get_linestyle(),
+        )
+        return True
+
+    def remove_line(self, name: str) -> bool:
+        """
+        Remove a named series from the plot.
+
+        Returns False if no series called *name* is on the plot. A legend
+        that is showing is rebuilt without it; like plot_line, the change is
+        shown by the next finalize_plot.
+        """
+        if name not in self._lines:
+            return False
+        line, index = self._lines.pop(name)
+        line.remove()
+        self._dense_lines.pop(line, None)
+        del self.data_lines[index]
+        # Series plotted after this one moved down a slot in data_lines
+        for other, (other_line, other_index) in self._lines.items():
+            if other_index > index:
+                self._lines[other] = (other_line, other_index - 1)
+        self._all_line_data = None
+
+        # The remaining data may cover less than before
+        self.ax.relim()
+        self._update_vline_limits()
+        self.ax.autoscale_view()
+
+        if self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+            loc, kwargs = self._legend_options
+            self.show_legend(loc, **kwargs)
+        return True
 
     def plot_stems(
         self,
@@ -437,13 +778,11 @@ class MatplotlibPlotWidget(QWidget):
         """
         try:
             # Ensure data is in numpy array format
-            x_data = np.asarray(x_data, dtype=np.float64)
-            y_data = np.asarray(y_data, dtype=np.float64)
+            x_data = _as_float(x_data)
+            y_data = _as_float(y_data)
 
             # Filter out non-positive values
-            mask = (y_data > 0) & np.isfinite(x_data) & np.isfinite(y_data)
-            x_data = x_data[mask]
-            y_data = y_data[mask]
+            x_data, y_data = _finite_xy(x_data, y_data, positive_y=True)
 
             if len(x_data) == 0:
                 logger.warning("No valid MS data to plot")
@@ -453,33 +792,31 @@ class MatplotlibPlotWidget(QWidget):
             # Store stem data for robust reset behavior
             self._last_stem_data = (x_data, y_data)
 
-            # Use matplotlib stem plot
-            markerline, stemlines, baseline = self.ax.stem(x_data, y_data, basefmt=" ")
-
-            # Set colors and widths
-            markerline.set_color(color)
-            markerline.set_markersize(0)  # Hide markers
-            stemlines.set_color(color)
-            stemlines.set_linewidth(width)
-
-            # Ensure Y axis starts at 0
-            y_min, y_max = self.ax.get_ylim()
-            self.ax.set_ylim(0, y_max * 1.1)
+            # Draw every stem as one segment of a single LineCollection;
+            # ax.stem would also build a hidden marker line and a baseline
+            segments = np.empty((len(x_data), 2, 2), dtype=x_data.dtype)
+            segments[:, :, 0] = x_data[:, None]
+            segments[:, 0, 1] = 0
+            segments[:, 1, 1] = y_data
+            self.ax.add_collection(
+                LineCollection(segments, colors=color, linewidths=width)
+            )
+            # Y axis starts at 0, with the usual autoscale margin plus 10%
+            # headroom above the tallest peak. Computed from the data rather
+            # than get_ylim(), which after an earlier set_ylim would return
+            # the previous spectrum's limits
+            y_margin = self.ax.margins()[1]
+            self.ax.set_ylim(0, y_data.max() * (1 + y_margin) * 1.1)
 
             # Set X axis limits based on actual data range with small padding
             x_min, x_max = x_data.min(), x_data.max()
             x_padding = (x_max - x_min) * 0.05 if x_max > x_min else 10
             self.ax.set_xlim(max(0, x_min - x_padding), x_max + x_padding)
 
-            # Use scientific notation for large numbers
-            if y_max > SCIENTIFIC_NOTATION_THRESHOLD:
-                self.ax.ticklabel_format(axis="y", style="scientific", scilimits=(0, 0))
-                self.ax.yaxis.get_offset_text().set_fontsize(8)
-
             # Defer canvas update for batch rendering
 
         except Exception as e:
-            logger.error(f"Failed to plot stems: {e}")
+            logger.error("Failed to plot stems: %s", e)
 
     def add_vertical_line(
         self,
@@ -497,15 +834,30 @@ class MatplotlibPlotWidget(QWidget):
             width: Line width
             style: Line style (solid, dashed, dotted)
         """
+        self.add_vertical_lines([x_position], color=color, width=width, style=style)
+
+    def add_vertical_lines(
+        self,
+        x_positions,
+        color: str = "red",
+        width: int = PLOT_GUIDELINE_WIDTH,
+        style: str = "solid",
+    ):
+        """
+        Add several vertical lines sharing one style in a single update.
+
+        Args:
+            x_positions: X coordinates for the lines
+            color: Line color
+            width: Line width
+            style: Line style (solid, dashed, dotted)
+        """
+        x_positions = list(x_positions)
+        if not x_positions:
+            return
         try:
             # Parse RGBA color format if provided
-            if color.startswith("rgba"):
-                import re
-
-                match = re.match(r"rgba\((\d+),(\d+),(\d+),([\d.]+)\)", color)
-                if match:
-                    r, g, b, a = match.groups()
-                    color = (int(r) / 255, int(g) / 255, int(b) / 255, float(a))
+            color = _parse_color(color)
 
             # Convert style to matplotlib format
             linestyle = "-"
@@ -514,19 +866,53 @@ class MatplotlibPlotWidget(QWidget):
             elif style == "dotted":
                 linestyle = ":"
 
-            # Add vertical line
-            self.ax.axvline(
-                x=x_position,
-                color=color,
-                linewidth=width,
-                linestyle=linestyle,
-                alpha=None if not isinstance(color, tuple) else color[3],
-            )
-
-            # Defer canvas update for batch rendering
+            # All guides are segments of one collection spanning the full
+            # height in axes coordinates, so they render as a single artist
+            created = self._vlines is None
+            if created:
+                self._vlines = self.ax.add_collection(
+                    LineCollection([], transform=self.ax.get_xaxis_transform()),
+                    autolim=False,
+                )
+            rgba = to_rgba(color)
+            self._vline_specs.extend((x, rgba, width, linestyle) for x in x_positions)
+            xs, colors, widths, styles = zip(*self._vline_specs)
+            segments = np.empty((len(xs), 2, 2))
+            segments[:, :, 0] = np.asarray(xs)[:, None]
+            segments[:, :, 1] = (0, 1)
+            self._vlines.set_segments(segments)
+            self._vlines.set_color(colors)
+            self._vlines.set_linewidth(widths)
+            # A list, since a (offset, dashes) tuple is itself a valid style
+            self._vlines.set_linestyle(list(styles))
+
+            # Like axvline, a guide widens the x-axis limits but not the y
+            xlim = self.ax.get_xlim()
+            self.ax.update_datalim([(x, 0) for x in x_positions], updatey=False)
+            self.ax.autoscale_view(scaley=False)
+
+            # Guides added while building a plot wait for finalize_plot. On an
+            # already drawn plot, a collection that is not in the cached
+            # background yet is blitted; otherwise the background already
+            # shows the earlier guides, and blitting would paint them twice.
+            # A guide that rescaled the view needs a full redraw either way
+            if self.ax.get_xlim() != xlim:
+                if self._background is not None:
+                    self._request_draw()
+            elif created or self._vlines in self._blit_artists:
+                self._blit_artist(self._vlines)
+            elif self._background is not None:
+                self._request_draw()
 
         except Exception as e:
-            logger.error(f"Failed to add vertical line: {e}")
+            logger.error("Failed to add vertical lines: %s", e)
+
+    def _update_vline_limits(self):
+        """Extend the x data limits to cover every vertical guide."""
+        if self._vline_specs:
+            self.ax.update_datalim(
+                [(x, 0) for x, *_ in self._vline_specs], updatey=False
+            )
 
     def show_legend(self, loc: str = "best", **kwargs):
         """
@@ -537,13 +923,19 @@ class MatplotlibPlotWidget(QWidget):
             **kwargs: Additional keyword arguments forwarded to ax.legend().
         """
         try:
-            handles, labels = self.ax.get_legend_handles_labels()
             # Avoid creating an empty legend
-            if not labels:
+            if not self._lines:
                 return
+            # Named lines are the only labelled artists, and _lines already
+            # holds them in plot order, so there is no need to have matplotlib
+            # scan every child of the axes (twice) for handles and labels
+            labels = list(self._lines)
+            handles = [line for line, _ in self._lines.values()]
 
             # Slightly smaller font than axis labels for a clean look
             legend = self.ax.legend(
+                handles,
+                labels,
                 loc=loc,
                 fontsize=max(PLOT_LABEL_FONTSIZE - 1, 6),
                 frameon=True,
@@ -551,9 +943,11 @@ class MatplotlibPlotWidget(QWidget):
             )
             # Keep a reference if needed later (optional)
             self._legend = legend
+            # remove_line() rebuilds the legend with the same options
+            self._legend_options = (loc, kwargs)
 
         except Exception as e:
-            logger.error(f"Failed to show legend: {e}")
+            logger.error("Failed to show legend: %s", e)
 
     def add_text(
         self,
@@ -597,7 +991,7 @@ class MatplotlibPlotWidget(QWidget):
                 **kwargs,
             )
         except Exception as e:
-            logger.error(f"Failed to add text annotation: {e}")
+            logger.error("Failed to add text annotation: %s", e)
 
     def set_title(self, title: str):
         """Update the plot title."""
@@ -605,20 +999,50 @@ class MatplotlibPlotWidget(QWidget):
         self.ax.set_title(title, fontsize=10, pad=5)
         # Don't draw yet
 
-    def finalize_plot(self):
-        """Finalize plot after all data is added - single draw call for speed."""
+    def finalize_plot(self, force: bool = False):
+        """
+        Finalize plot after all data is added - single draw call for speed.
+
+        The draw is scheduled with draw_idle so back-to-back updates coalesce
+        into one render on the next event-loop pass; ``force=True`` renders
+        synchronously instead.
+        """
         # Ensure grid is visible
         self.ax.grid(True, alpha=0.2, linestyle="-", linewidth=0.5)
 
         # For time axis, format nicely
         if "time" in self.x_label.lower() or "min" in self.x_label.lower():
             # Format x-axis to show clear decimal minutes
-            from matplotlib.ticker import FormatStrFormatter
-
-            self.ax.xaxis.set_major_formatter(FormatStrFormatter("%.2f"))
+            if self.ax.xaxis.get_major_formatter() is not self._TIME_FORMATTER:
+                self.ax.xaxis.set_major_formatter(self._TIME_FORMATTER)
 
         # Single draw call for all updates - much faster
-        self.canvas.draw()
+        self._request_draw(force)
+
+    def _request_draw(self, force: bool = False):
+        """Draw (or schedule a draw) unless inside batch_updates()."""
+        if self._draw_depth:
+            return
+        if force:
+            self.canvas.draw()
+        else:
+            self.canvas.draw_idle()
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Suppress draws and blits while several updates are applied.
+
+        Reentrant: only leaving the outermost block schedules the single
+        draw_idle that shows everything added inside it.
+        """
+        self._draw_depth += 1
+        try:
+            yield self
+        finally:
+            self._draw_depth -= 1
+            if self._draw_depth == 0:
+                self.canvas.draw_idle()
 
     def cleanup(self):
         """Properly cleanup matplotlib resources to prevent memory leaks."""
@@ -647,11 +1071,13 @@ class MatplotlibPlotWidget(QWidget):
             # Clear data storage
             if hasattr(self, "data_lines"):
                 self.data_lines = []
+                self._all_line_data = None
+                self._dense_lines = {}
 
             logger.debug("Matplotlib resources cleaned up successfully")
 
         except Exception as e:
-            logger.error(f"Error during matplotlib cleanup: {e}")
+            logger.error("Error during matplotlib cleanup: %s", e)
 
     def closeEvent(self, event):
         """Handle widget close event."""
@@ -20,6 +20,7 @@ running from a frozen executable (MEIPASS staging directory).
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -35,6 +36,7 @@ def _frozen_base() -> Path:
     return Path(getattr(sys, "_MEIPASS", ""))
 
 
+@lru_cache(maxsize=None)
 def _package_base() -> Path:
     """Return the manic package root: .../src/manic."""
     # This file lives at .../src/manic/utils/paths.py
@@ -42,6 +44,7 @@ def _package_base() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=None)
 def _project_base() -> Path:
     """Return the project root directory (the folder that contains docs/)."""
     return Path(__file__).resolve().parents[3]
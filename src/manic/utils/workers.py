@@ -1,16 +1,18 @@
 # In src/manic/utils/workers.py
 import json
+import threading
 import urllib.request
 from typing import Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThread, Signal, Slot
 
 from manic.__version__ import __version_info__
 from manic.io.eic_importer import (
     import_eics,
     regenerate_all_eics_with_mass_tolerance,
-    regenerate_compound_eics,
 )
+from manic.io.sample_reader import list_active_samples
+from manic.models.database import clear_database
 
 
 class UpdateCheckWorker(QThread):
@@ -64,64 +66,126 @@ class UpdateCheckWorker(QThread):
             return (0, 0, 0)
 
 
-class CdfImportWorker(QObject):
-    progress = Signal(int, int)  # current, total
-    finished = Signal(int)  # rows inserted
+def percent_progress(emit):
+    """
+    Adapt a percent setter (a signal's ``emit`` or ``QProgressDialog.setValue``)
+    to the ``progress_cb(done, total)`` convention, calling it only when the
+    whole percentage changes so a long batch triggers at most ~100 updates.
+
+    Callers that already report a 0-100 value (the exporters) can call it
+    with that value alone; fractional percentages are floored.
+    """
+    last_pct = -1
+
+    def progress_cb(done: float, total: float = 100) -> None:
+        nonlocal last_pct
+        pct = int(done * 100 // total) if total > 0 else 0
+        if pct != last_pct:
+            last_pct = pct
+            emit(pct)
+
+    return progress_cb
+
+
+class WorkerSignals(QObject):
+    """Signals for Worker; QRunnable is not a QObject so it can't own them."""
+
+    progress = Signal(int)  # percent complete, 0-100
+    finished = Signal(object)  # return value of the wrapped function
+    cancelled = Signal(object)  # return value after cancel() was honoured
     failed = Signal(str)
 
-    def __init__(self, directory: str, mass_tolerance: float = 0.2):
+
+class Worker(QRunnable):
+    """
+    Run a function on QThreadPool and report back through ``self.signals``.
+
+    With ``progress_callback=True`` the function receives a
+    ``progress_cb(done, total)``, matching the convention of the import and
+    regeneration functions, which emits ``signals.progress`` as a percentage
+    (see ``percent_progress``). Pass a keyword name instead of True for
+    functions that take the callback under another name, e.g.
+    ``progress_callback="progress_callback"`` for the exporters.
+
+    With ``cancellable=True`` it also receives ``should_cancel``, which
+    returns True once ``cancel()`` has been called. The function must stop
+    when it sees True, and the run then emits ``cancelled`` instead of
+    ``finished``; a cancel that arrives after the last check is too late to
+    stop anything, so that run still emits ``finished``.
+    """
+
+    def __init__(
+        self,
+        fn,
+        *args,
+        progress_callback: bool | str = False,
+        cancellable: bool = False,
+        **kwargs,
+    ):
         super().__init__()
-        self._directory = directory
-        self._mass_tolerance = mass_tolerance
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancel_requested = threading.Event()
+        if progress_callback:
+            name = "progress_cb" if progress_callback is True else progress_callback
+            self.kwargs[name] = percent_progress(self.signals.progress.emit)
+        if cancellable:
+            self.kwargs["should_cancel"] = self._should_cancel
+        # Set once should_cancel has answered True, i.e. the function stopped
+        self._stopped_early = False
+
+    def cancel(self):
+        """Ask the function to stop at its next ``should_cancel`` check."""
+        self._cancel_requested.set()
+
+    def _should_cancel(self) -> bool:
+        if self._cancel_requested.is_set():
+            self._stopped_early = True
+            return True
+        return False
 
     @Slot()
     def run(self):
         try:
-            count = import_eics(
-                self._directory,
-                mass_tol=self._mass_tolerance,
-                progress_cb=self.progress.emit,  # <- hand in the signal
-            )
-            self.finished.emit(count)
+            result = self.fn(*self.args, **self.kwargs)
         except Exception as exc:
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
+        else:
+            if self._stopped_early:
+                self.signals.cancelled.emit(result)
+            else:
+                self.signals.finished.emit(result)
 
 
-class EicRegenerationWorker(QObject):
+class CdfImportWorker(QObject):
     progress = Signal(int, int)  # current, total
-    finished = Signal(int)  # eics regenerated
+    finished = Signal(int, list)  # rows inserted, active sample names
     failed = Signal(str)
 
-    def __init__(
-        self,
-        compound_name: str,
-        tr_window: float,
-        sample_names: list,
-        retention_time: float,
-    ):
+    def __init__(self, directory: str, mass_tolerance: float = 0.2):
         super().__init__()
-        self._compound_name = compound_name
-        self._tr_window = tr_window
-        self._sample_names = sample_names
-        self._retention_time = retention_time
+        self._directory = directory
+        self._mass_tolerance = mass_tolerance
 
     @Slot()
     def run(self):
         try:
-            count = regenerate_compound_eics(
-                compound_name=self._compound_name,
-                tr_window=self._tr_window,
-                sample_names=self._sample_names,
-                progress_cb=self.progress.emit,
-                retention_time=self._retention_time,
+            count = import_eics(
+                self._directory,
+                mass_tol=self._mass_tolerance,
+                progress_cb=self.progress.emit,  # <- hand in the signal
             )
-            self.finished.emit(count)
+            # Read the freshly imported sample list here so the GUI thread
+            # doesn't have to re-query the database on completion
+            self.finished.emit(count, list_active_samples())
         except Exception as exc:
             self.failed.emit(str(exc))
 
 
 class MassToleranceReloadWorker(QObject):
-    progress = Signal(int, int)  # current, total
+    progress = Signal(int)  # percent complete, 0-100
     finished = Signal(int)  # eics regenerated
     failed = Signal(str)
 
@@ -136,8 +200,22 @@ class MassToleranceReloadWorker(QObject):
             count = regenerate_all_eics_with_mass_tolerance(
                 mass_tol=self._mass_tol,
                 rt_window=self._rt_window,
-                progress_cb=self.progress.emit,
+                progress_cb=percent_progress(self.progress.emit),
             )
             self.finished.emit(count)
         except Exception as exc:
             self.failed.emit(str(exc))
+
+
+class ClearDatabaseWorker(QObject):
+    progress = Signal(int, int, str)  # current, total, operation
+    finished = Signal()
+    failed = Signal(str)
+
+    @Slot()
+    def run(self):
+        try:
+            clear_database(progress_callback=self.progress.emit)
+            self.finished.emit()
+        except Exception as exc:
+            self.failed.emit(str(exc))
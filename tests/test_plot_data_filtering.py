@@ -0,0 +1,105 @@
+"""
+Tests for the data and colour helpers used by the matplotlib plot widget.
+
+These helpers run on every trace before it reaches matplotlib, so clean
+input must pass through untouched and invalid points must be dropped
+exactly as the original per-call masks did.
+"""
+
+import numpy as np
+
+# matplotlib's Qt compatibility layer uses whichever binding is already
+# imported, as the application does
+import PySide6.QtWidgets  # noqa: F401
+
+from manic.ui.matplotlib_plot_widget import (  # noqa: E402
+    _as_float,
+    _decimate_minmax,
+    _finite_xy,
+    _parse_color,
+)
+
+
+def test_clean_input_is_returned_without_copy():
+    x = np.linspace(0.0, 10.0, 50)
+    y = np.linspace(1.0, 2.0, 50)
+
+    x_out, y_out = _finite_xy(x, y)
+
+    assert x_out is x
+    assert y_out is y
+
+
+def test_non_finite_points_are_dropped():
+    x = np.array([0.0, 1.0, np.nan, 3.0, 4.0])
+    y = np.array([1.0, np.inf, 2.0, -np.inf, 5.0])
+
+    x_out, y_out = _finite_xy(x, y)
+
+    np.testing.assert_array_equal(x_out, [0.0, 4.0])
+    np.testing.assert_array_equal(y_out, [1.0, 5.0])
+
+
+def test_positive_y_drops_zero_and_negative_intensities():
+    x = np.array([100.0, 101.0, 102.0, 103.0])
+    y = np.array([5.0, 0.0, -1.0, 2.0])
+
+    x_out, y_out = _finite_xy(x, y, positive_y=True)
+
+    np.testing.assert_array_equal(x_out, [100.0, 103.0])
+    np.testing.assert_array_equal(y_out, [5.0, 2.0])
+
+
+def test_overflowing_sum_still_keeps_all_finite_points():
+    x = np.array([0.0, 1.0])
+    y = np.array([1e308, 1e308])
+
+    x_out, y_out = _finite_xy(x, y)
+
+    np.testing.assert_array_equal(x_out, x)
+    np.testing.assert_array_equal(y_out, y)
+
+
+def test_empty_input():
+    x_out, y_out = _finite_xy(np.array([]), np.array([]))
+
+    assert x_out.size == 0
+    assert y_out.size == 0
+
+
+def test_parse_color_converts_rgba_strings():
+    assert _parse_color("rgba(255,0,0,0.5)") == (1.0, 0.0, 0.0, 0.5)
+
+
+def test_parse_color_passes_other_formats_through():
+    assert _parse_color("#00ff00") == "#00ff00"
+    assert _parse_color("darkred") == "darkred"
+    assert _parse_color((0.0, 0.0, 1.0, 1.0)) == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_decimate_minmax_keeps_extremes_and_endpoints():
+    x = np.linspace(0.0, 10.0, 10_001)
+    y = np.sin(x * 7.0) * np.exp(-((x - 5.0) ** 2))
+
+    x_out, y_out = _decimate_minmax(x, y, 500)
+
+    assert len(x_out) <= 2 * 500 + 4
+    assert x_out[0] == x[0] and x_out[-1] == x[-1]
+    assert y_out.max() == y.max() and y_out.min() == y.min()
+    assert np.all(np.diff(x_out) > 0)
+
+
+def test_decimate_minmax_leaves_sparse_data_alone():
+    x = np.arange(100.0)
+    y = x**2
+
+    x_out, y_out = _decimate_minmax(x, y, 80)
+
+    assert x_out is x and y_out is y
+
+
+def test_as_float_keeps_float32_and_upcasts_integers():
+    f32 = np.arange(5, dtype=np.float32)
+
+    assert _as_float(f32) is f32
+    assert _as_float([1, 2, 3]).dtype == np.float64
@@ -0,0 +1,101 @@
+"""
+Tests for updating and removing named series on the matplotlib plot widget.
+
+update_line and remove_line look series up in the widget's name registry,
+so removing one series must keep the registry, data_lines and legend in
+step for the series that remain.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Render without a display; must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from manic.ui.matplotlib_plot_widget import MatplotlibPlotWidget  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for UI tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def plot(qapp):
+    """Plot widget holding three named series, M0 to M2."""
+    widget = MatplotlibPlotWidget()
+    x = np.linspace(0.0, 10.0, 20)
+    for i, colour in enumerate(("red", "green", "blue")):
+        widget.plot_line(x, np.full(20, float(i + 1)), color=colour, name=f"M{i}")
+    yield widget
+    widget.deleteLater()
+
+
+def _legend_labels(widget):
+    return [text.get_text() for text in widget.ax.get_legend().get_texts()]
+
+
+def test_remove_middle_series_reindexes_the_rest(plot):
+    assert plot.remove_line("M1")
+
+    assert list(plot._lines) == ["M0", "M2"]
+    assert len(plot.data_lines) == 2
+    assert len(plot.ax.lines) == 2
+    for name, (line, index) in plot._lines.items():
+        # Each remaining series still points at its own data
+        np.testing.assert_array_equal(plot.data_lines[index][1], line.get_ydata())
+    np.testing.assert_array_equal(plot.all_line_data()[1], [1.0] * 20 + [3.0] * 20)
+
+
+def test_remove_unknown_series_is_a_no_op(plot):
+    assert not plot.remove_line("M9")
+    assert list(plot._lines) == ["M0", "M1", "M2"]
+
+
+def test_update_after_removal_targets_the_right_series(plot):
+    plot.remove_line("M1")
+    x = np.linspace(0.0, 5.0, 10)
+
+    assert plot.update_line("M2", x, np.full(10, 7.0))
+
+    line, index = plot._lines["M2"]
+    np.testing.assert_array_equal(plot.data_lines[index][1], np.full(10, 7.0))
+    np.testing.assert_array_equal(line.get_ydata(), np.full(10, 7.0))
+    # Styling is kept and M0 is untouched
+    assert line.get_color() == "blue"
+    m0_line, m0_index = plot._lines["M0"]
+    np.testing.assert_array_equal(plot.data_lines[m0_index][1], np.full(20, 1.0))
+    assert len(plot.ax.lines) == 2
+
+
+def test_update_of_removed_series_returns_false(plot):
+    plot.remove_line("M1")
+    assert not plot.update_line("M1", np.arange(3.0), np.arange(3.0))
+    assert "M1" not in plot._lines
+
+
+def test_visible_legend_is_rebuilt_without_removed_series(plot):
+    plot.show_legend(loc="upper left", title="Isotopologue")
+    assert _legend_labels(plot) == ["M0", "M1", "M2"]
+
+    plot.remove_line("M1")
+
+    legend = plot.ax.get_legend()
+    assert _legend_labels(plot) == ["M0", "M2"]
+    assert [h.get_color() for h in legend.legend_handles] == ["red", "blue"]
+    # The rebuilt legend keeps the options it was shown with
+    assert legend.get_title().get_text() == "Isotopologue"
+
+
+def test_hidden_legend_stays_hidden(plot):
+    plot.remove_line("M0")
+    assert plot.ax.get_legend() is None
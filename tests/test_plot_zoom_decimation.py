@@ -0,0 +1,124 @@
+"""
+Tests for redrawing decimated traces when the plot is zoomed or panned.
+
+Dense traces are drawn from a per-pixel min/max envelope of the full x
+range; zooming in must re-decimate the visible range from the full arrays
+so the real samples are shown rather than the coarse envelope.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Render without a display; must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from manic.ui.matplotlib_plot_widget import MatplotlibPlotWidget  # noqa: E402
+
+N_POINTS = 200_000
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for UI tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def plot(qapp):
+    """Plot widget holding one trace far denser than the screen is wide."""
+    widget = MatplotlibPlotWidget()
+    x = np.linspace(0.0, 20.0, N_POINTS)
+    y = np.sin(x * 50.0) + x
+    widget.plot_line(x, y, color="black", name="TIC")
+    widget.ax.set_xlim(0.0, 20.0)
+    yield widget
+    widget.deleteLater()
+
+
+def _plotted(widget):
+    line, _ = widget._lines["TIC"]
+    return line.get_xdata(), line.get_ydata()
+
+
+def _visible(x, lo, hi):
+    return (x >= lo) & (x <= hi)
+
+
+def test_full_view_is_decimated(plot):
+    x_plot, _ = _plotted(plot)
+    assert len(x_plot) <= 4 * plot._pixel_columns() + 4
+    assert len(x_plot) < N_POINTS
+
+
+def test_zoom_in_shows_every_sample_in_view(plot):
+    x_full, y_full = plot.data_lines[0]
+    lo, hi = 5.0, 5.02  # ~200 samples, far fewer than the pixel columns
+
+    plot.ax.set_xlim(lo, hi)
+
+    x_plot, y_plot = _plotted(plot)
+    in_view = _visible(x_plot, lo, hi)
+    full_in_view = _visible(x_full, lo, hi)
+    assert in_view.sum() == full_in_view.sum()
+    np.testing.assert_array_equal(x_plot[in_view], x_full[full_in_view])
+    np.testing.assert_array_equal(y_plot[in_view], y_full[full_in_view])
+
+
+def test_wide_zoom_is_re_decimated_at_screen_resolution(plot):
+    columns = plot._pixel_columns()
+    x_full, _ = plot.data_lines[0]
+    lo, hi = 2.0, 12.0  # still denser than the screen
+
+    plot.ax.set_xlim(lo, hi)
+
+    x_plot, _ = _plotted(plot)
+    in_view = _visible(x_plot, lo, hi).sum()
+    # Finer than the full-range envelope, but still bounded by the screen
+    full_range_points = 2 * columns * (hi - lo) / 20.0
+    assert in_view > 1.5 * full_range_points
+    assert in_view <= 2 * columns + 4
+    assert in_view < _visible(x_full, lo, hi).sum()
+
+
+def test_pan_follows_the_view(plot):
+    x_full, _ = plot.data_lines[0]
+    plot.ax.set_xlim(5.0, 5.02)
+    plot.ax.set_xlim(15.0, 15.02)
+
+    x_plot, _ = _plotted(plot)
+    full_in_view = _visible(x_full, 15.0, 15.02).sum()
+    assert _visible(x_plot, 15.0, 15.02).sum() == full_in_view
+
+
+def test_zoom_out_restores_envelope_and_data_limits(plot):
+    x_full, y_full = plot.data_lines[0]
+    envelope_len = len(_plotted(plot)[0])
+
+    plot.ax.set_xlim(5.0, 5.02)
+    # The zoomed line still spans the full data range
+    plot.ax.relim()
+    np.testing.assert_allclose(plot.ax.dataLim.intervaly, [y_full.min(), y_full.max()])
+    np.testing.assert_allclose(plot.ax.dataLim.intervalx, [0.0, 20.0])
+
+    plot.ax.set_xlim(0.0, 20.0)
+    assert len(_plotted(plot)[0]) == envelope_len
+
+
+def test_update_while_zoomed_uses_the_current_view(plot):
+    plot.ax.set_xlim(5.0, 5.02)
+    x = np.linspace(0.0, 20.0, N_POINTS)
+
+    plot.update_line("TIC", x, np.cos(x))
+
+    x_plot, y_plot = _plotted(plot)
+    in_view = _visible(x_plot, 5.0, 5.02)
+    assert in_view.sum() == _visible(x, 5.0, 5.02).sum()
+    np.testing.assert_array_equal(y_plot[in_view], np.cos(x_plot[in_view]))